@@ -4,18 +4,51 @@ FastAPI Routes for Gun Registry Adapter.
 Provides REST API endpoints for eligibility checking.
 """
 
+import asyncio
 import base64
-import tempfile
-from pathlib import Path
+import functools
+import hashlib
+import io
 from typing import Optional
 from datetime import datetime
 
+import cv2
+import numpy as np
+
+# SIMD-accelerated base64 (libbase64); falls back to the scalar stdlib decoder
+try:
+    import pybase64
+    _b64decode = pybase64.b64decode
+except ImportError:
+    _b64decode = base64.b64decode
+
+# Bounded TTL cache for duplicate submissions (retries, n8n replays)
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# BLAKE3 is SIMD-vectorized and 3-10x faster than SHA-256 on short inputs;
+# the digest is only used for log correlation, so the fallback is equivalent
+try:
+    from blake3 import blake3 as _id_hash_fn
+except ImportError:
+    _id_hash_fn = hashlib.sha256
+
 from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from adapter.core.engine import EligibilityEngine, EligibilityDecision
+from adapter.core.batching import DynamicBatcher
+from adapter.exceptions.parser_exceptions import (
+    PerceptionError,
+    APITimeoutError,
+    ReasoningError,
+    LinkageError,
+)
 from adapter.config.logging_config import logger
-from adapter.config.settings import settings
+from adapter.config.settings import settings, HOT
 
 
 # ============================================================================
@@ -28,13 +61,15 @@ class EligibilityRequest(BaseModel):
     id_image_base64: Optional[str] = Field(None, description="Base64-encoded driver license image")
     id_image_url: Optional[str] = Field(None, description="URL to driver license image")
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "revalidate_instances": "never",  # Validate once at the API boundary
+        "json_schema_extra": {
             "example": {
                 "applicant_id": "550e8400-e29b-41d4-a716-446655440000",
                 "id_image_base64": "iVBORw0KGgoAAAANSUhEUg..."
             }
         }
+    }
 
 
 class EligibilityResponse(BaseModel):
@@ -49,8 +84,9 @@ class EligibilityResponse(BaseModel):
     decision_rationale: list
     timestamp: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "revalidate_instances": "never",
+        "json_schema_extra": {
             "example": {
                 "applicant_id": "550e8400-e29b-41d4-a716-446655440000",
                 "decision": "APPROVED",
@@ -77,6 +113,7 @@ class EligibilityResponse(BaseModel):
                 "timestamp": "2024-01-15T10:30:00Z"
             }
         }
+    }
 
 
 class ErrorResponse(BaseModel):
@@ -87,6 +124,8 @@ class ErrorResponse(BaseModel):
     retry_recommended: bool = False
     self_healing_triggered: bool = False
 
+    model_config = {"revalidate_instances": "never"}
+
 
 class RegistrySubmitRequest(BaseModel):
     """Request model for registry submission."""
@@ -94,6 +133,8 @@ class RegistrySubmitRequest(BaseModel):
     eligibility_decision: str
     applicant_data: dict
 
+    model_config = {"revalidate_instances": "never"}
+
 
 class RegistrySubmitResponse(BaseModel):
     """Response model for registry submission."""
@@ -101,16 +142,78 @@ class RegistrySubmitResponse(BaseModel):
     status: str
     timestamp: str
 
+    model_config = {"revalidate_instances": "never"}
+
+
+class EligibilityBatchRequest(BaseModel):
+    """Request model for batched eligibility checks."""
+    requests: list[EligibilityRequest]
+
+    model_config = {"revalidate_instances": "never"}
+
 
 # ============================================================================
 # Router
 # ============================================================================
 
-router = APIRouter(prefix="/api/v1", tags=["eligibility"])
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["eligibility"],
+    default_response_class=ORJSONResponse
+)
+
+# Exception class -> (error_code, retry_recommended); checked in order, first
+# match wins. Subclass dispatch replaces substring matching on type names.
+_ERROR_MAP = (
+    (PerceptionError, ("OCR_FAILED", True)),
+    (APITimeoutError, ("API_ERROR", True)),
+    (ReasoningError, ("API_ERROR", True)),
+    (LinkageError, ("LINKAGE_FAILED", False)),
+)
+
+
+def _classify_error(exc: Exception) -> tuple:
+    """Map an exception to its (error_code, retry_recommended) pair."""
+    for exc_class, info in _ERROR_MAP:
+        if isinstance(exc, exc_class):
+            return info
+    return ("INTERNAL_ERROR", False)
+
+
+# Content-addressed result cache: identical image bytes short-circuit the
+# whole OCR+linkage+risk pipeline. MANUAL_REVIEW decisions are never cached.
+if TTLCache is not None and HOT.enable_caching:
+    _result_cache = TTLCache(maxsize=1024, ttl=HOT.cache_ttl)
+else:
+    _result_cache = None
+
+
+def _image_cache_key(image_bytes: bytes) -> str:
+    """Content hash of raw image bytes for result caching."""
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+
+def _cached_result(image_bytes: bytes):
+    """Return (cache_key, cached_payload) for the image, if caching is on."""
+    if _result_cache is None:
+        return None, None
+    key = _image_cache_key(image_bytes)
+    return key, _result_cache.get(key)
+
+
+def _store_result(cache_key, result, payload: dict):
+    """Cache a finished payload unless it requires manual review."""
+    if _result_cache is None or cache_key is None:
+        return
+    if result.decision != EligibilityDecision.MANUAL_REVIEW:
+        _result_cache[cache_key] = payload
 
 # Initialize eligibility engine (singleton)
 engine: Optional[EligibilityEngine] = None
 
+# Dynamic batcher for Model A OCR (singleton, coalesces concurrent requests)
+ocr_batcher: Optional[DynamicBatcher] = None
+
 
 def get_engine() -> EligibilityEngine:
     """Get or create eligibility engine instance."""
@@ -120,6 +223,18 @@ def get_engine() -> EligibilityEngine:
     return engine
 
 
+def get_ocr_batcher() -> DynamicBatcher:
+    """Get or create the dynamic OCR batcher instance."""
+    global ocr_batcher
+    if ocr_batcher is None:
+        ocr_batcher = DynamicBatcher(
+            infer_fn=get_engine().perception.extract_batch,
+            max_batch_size=settings.ocr_batch_max_size,
+            max_delay=settings.ocr_batch_max_delay
+        )
+    return ocr_batcher
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -141,87 +256,38 @@ async def check_eligibility(request: EligibilityRequest):
     Returns:
         EligibilityResponse with decision and all intermediate outputs
     """
+    aid_hash = _hash_id(request.applicant_id)
+
     try:
         logger.info(
             "Received eligibility check request",
-            extra={"applicant_id_hash": _hash_id(request.applicant_id)}
+            extra={"applicant_id_hash": aid_hash}
         )
 
-        # Validate request
-        if not request.id_image_base64 and not request.id_image_url:
-            raise HTTPException(
-                status_code=400,
-                detail="Either id_image_base64 or id_image_url must be provided"
-            )
-
-        # Handle base64 image
-        if request.id_image_base64:
-            image_path = _save_base64_image(request.id_image_base64)
-        else:
-            # TODO: Download image from URL
-            raise HTTPException(
-                status_code=501,
-                detail="id_image_url not yet implemented, use id_image_base64"
-            )
-
-        # Run eligibility assessment
-        engine = get_engine()
-        result = engine.assess_eligibility(
-            applicant_id=request.applicant_id,
-            id_image_path=image_path
-        )
-
-        # Build response
-        response = EligibilityResponse(
-            applicant_id=result.applicant_id,
-            decision=result.decision.value,
-            confidence=result.confidence,
-            extracted_data=result.extracted_data,
-            risk_assessment={
-                "risk_score": result.risk_assessment.risk_score,
-                "risk_factors": result.risk_assessment.risk_factors,
-                "confidence": result.risk_assessment.confidence
-            },
-            linkage_result={
-                "matched": result.linkage_result.matched,
-                "confidence": result.linkage_result.confidence,
-                "field_scores": result.linkage_result.field_scores,
-                "requires_review": result.linkage_result.requires_review
-            },
-            requires_manual_review=result.requires_manual_review,
-            decision_rationale=result.decision_rationale,
-            timestamp=result.timestamp.isoformat()
-        )
+        payload = await _process_eligibility_request(request, aid_hash)
 
         logger.info(
             "Eligibility check complete",
             extra={
-                "applicant_id_hash": _hash_id(request.applicant_id),
-                "decision": result.decision.value,
-                "confidence": result.confidence
+                "applicant_id_hash": aid_hash,
+                "decision": payload["decision"],
+                "confidence": payload["confidence"]
             }
         )
 
-        return response
+        return ORJSONResponse(content=payload)
 
+    except HTTPException:
+        # Validation errors already carry the right status code
+        raise
     except Exception as e:
         logger.error(
             f"Eligibility check failed: {e}",
-            extra={"applicant_id_hash": _hash_id(request.applicant_id)},
+            extra={"applicant_id_hash": aid_hash},
             exc_info=True
         )
 
-        # Determine error type
-        error_type = type(e).__name__
-        if "OCR" in error_type:
-            error_code = "OCR_FAILED"
-            retry_recommended = True
-        elif "API" in error_type:
-            error_code = "API_ERROR"
-            retry_recommended = True
-        else:
-            error_code = "INTERNAL_ERROR"
-            retry_recommended = False
+        error_code, retry_recommended = _classify_error(e)
 
         raise HTTPException(
             status_code=500,
@@ -234,6 +300,130 @@ async def check_eligibility(request: EligibilityRequest):
         )
 
 
+async def _process_eligibility_request(request: EligibilityRequest, aid_hash: str) -> dict:
+    """
+    Run the full eligibility pipeline for one JSON request.
+
+    Shared by the single and batch endpoints. Decodes the image in-memory,
+    consults the duplicate-submission cache, submits OCR through the dynamic
+    batcher, and runs the remaining sync stages in a worker thread.
+
+    Args:
+        request: Validated eligibility request
+        aid_hash: Precomputed applicant ID hash for logging
+
+    Returns:
+        Response payload dict
+
+    Raises:
+        HTTPException: For validation failures
+    """
+    # Validate request
+    if not request.id_image_base64 and not request.id_image_url:
+        raise HTTPException(
+            status_code=400,
+            detail="Either id_image_base64 or id_image_url must be provided"
+        )
+
+    # Handle base64 image (decode in-memory - no tempfile round-trip).
+    # Decoding multi-MB payloads is CPU-bound, so keep it off the event loop.
+    if request.id_image_base64:
+        # Enforce the upload cap before allocating the decoded bytes: n base64
+        # chars decode to ~3n/4 bytes, so an oversized payload is rejected
+        # without ever materializing it in memory
+        expected_bytes = (len(request.id_image_base64) * 3) // 4
+        if expected_bytes > HOT.max_upload_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Image exceeds {settings.max_file_upload_size_mb} MB limit"
+            )
+        image_bytes = await asyncio.to_thread(_b64decode, request.id_image_base64)
+    else:
+        # TODO: Download image from URL
+        raise HTTPException(
+            status_code=501,
+            detail="id_image_url not yet implemented, use id_image_base64"
+        )
+
+    # Short-circuit duplicate submissions of the same image content
+    cache_key, cached = _cached_result(image_bytes)
+    if cached is not None:
+        logger.info(
+            "Eligibility result served from cache",
+            extra={"applicant_id_hash": aid_hash}
+        )
+        return {**cached, "applicant_id": request.applicant_id}
+
+    image = await asyncio.to_thread(_decode_image_bytes, image_bytes)
+
+    # Run eligibility assessment (OCR step batched across concurrent
+    # requests; the remaining sync stages run in a worker thread so the
+    # event loop stays free for other requests)
+    engine = get_engine()
+    ocr_result = await get_ocr_batcher().submit(image)
+    result = await asyncio.to_thread(
+        engine.assess_eligibility,
+        applicant_id=request.applicant_id,
+        id_image=image,
+        ocr_result=ocr_result
+    )
+
+    payload = _eligibility_payload(result)
+    _store_result(cache_key, result, payload)
+    return payload
+
+
+@router.post("/eligibility/batch")
+async def check_eligibility_batch(batch: EligibilityBatchRequest):
+    """
+    Check firearm eligibility for multiple applicants in one request.
+
+    Amortizes HTTP/JSON overhead for bulk runs: all checks execute
+    concurrently server-side, and their OCR steps collapse into shared
+    PaddleOCR batches via the dynamic batcher. Per-applicant failures are
+    reported inline so one bad image doesn't fail the whole batch.
+
+    Args:
+        batch: List of eligibility requests
+
+    Returns:
+        List of per-applicant response payloads (or inline error objects)
+    """
+    if len(batch.requests) > settings.api_max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch size {len(batch.requests)} exceeds limit of {settings.api_max_batch_size}"
+        )
+
+    logger.info(
+        "Received batch eligibility request",
+        extra={"batch_size": len(batch.requests)}
+    )
+
+    results = await asyncio.gather(
+        *(
+            _process_eligibility_request(r, _hash_id(r.applicant_id))
+            for r in batch.requests
+        ),
+        return_exceptions=True
+    )
+
+    responses = []
+    for request, result in zip(batch.requests, results):
+        if isinstance(result, Exception):
+            error_code, retry_recommended = _classify_error(result)
+            responses.append({
+                "applicant_id": request.applicant_id,
+                "error": error_code,
+                "message": str(result),
+                "retry_recommended": retry_recommended
+            })
+        else:
+            responses.append(result)
+
+    return ORJSONResponse(content={"results": responses})
+
+
 @router.post("/eligibility/upload", response_model=EligibilityResponse)
 async def check_eligibility_upload(
     applicant_id: str,
@@ -263,10 +453,12 @@ async def check_eligibility_upload(
           -F "applicant_id=12345" \
           -F "id_image=@/path/to/license.png"
     """
+    aid_hash = _hash_id(applicant_id)
+
     try:
         logger.info(
             "Received eligibility check request (file upload)",
-            extra={"applicant_id_hash": _hash_id(applicant_id)}
+            extra={"applicant_id_hash": aid_hash}
         )
 
         # Validate file type
@@ -276,46 +468,50 @@ async def check_eligibility_upload(
                 detail=f"Invalid file type: {id_image.content_type}. Must be an image."
             )
 
-        # Save uploaded file to temp location
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-        content = await id_image.read()
-        temp_file.write(content)
-        temp_file.close()
-        image_path = temp_file.name
+        # Stream upload in fixed-size chunks (no whole-file read), enforcing
+        # the size cap early so oversized uploads abort before buffering fully
+        max_bytes = HOT.max_upload_bytes
+        buffer = io.BytesIO()
+        while chunk := await id_image.read(4096):
+            buffer.write(chunk)
+            if buffer.tell() > max_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Uploaded file exceeds {settings.max_file_upload_size_mb} MB limit"
+                )
+        image = buffer.getvalue()
+
+        # Short-circuit duplicate submissions of the same image content
+        cache_key, cached = _cached_result(image)
+        if cached is not None:
+            logger.info(
+                "Eligibility result served from cache (file upload)",
+                extra={"applicant_id_hash": aid_hash}
+            )
+            return ORJSONResponse(content={**cached, "applicant_id": applicant_id})
 
-        # Run eligibility assessment
+        # Run eligibility assessment (OCR step batched across concurrent
+        # requests; the remaining sync stages run in a worker thread so the
+        # event loop stays free for other requests)
         engine = get_engine()
-        result = engine.assess_eligibility(
+        ocr_result = await get_ocr_batcher().submit(image)
+        result = await asyncio.to_thread(
+            engine.assess_eligibility,
             applicant_id=applicant_id,
-            id_image_path=image_path
+            id_image=image,
+            ocr_result=ocr_result
         )
 
-        # Build response
-        response = EligibilityResponse(
-            applicant_id=result.applicant_id,
-            decision=result.decision.value,
-            confidence=result.confidence,
-            extracted_data=result.extracted_data,
-            risk_assessment={
-                "risk_score": result.risk_assessment.risk_score,
-                "risk_factors": result.risk_assessment.risk_factors,
-                "confidence": result.risk_assessment.confidence
-            },
-            linkage_result={
-                "matched": result.linkage_result.matched,
-                "confidence": result.linkage_result.confidence,
-                "field_scores": result.linkage_result.field_scores,
-                "requires_review": result.linkage_result.requires_review
-            },
-            requires_manual_review=result.requires_manual_review,
-            decision_rationale=result.decision_rationale,
-            timestamp=result.timestamp.isoformat()
-        )
+        # Build response payload (serialized by ORJSONResponse; the pydantic
+        # model stays for OpenAPI schema only)
+        payload = _eligibility_payload(result)
+        _store_result(cache_key, result, payload)
+        response = ORJSONResponse(content=payload)
 
         logger.info(
             "Eligibility check complete (file upload)",
             extra={
-                "applicant_id_hash": _hash_id(applicant_id),
+                "applicant_id_hash": aid_hash,
                 "decision": result.decision.value,
                 "confidence": result.confidence
             }
@@ -323,10 +519,13 @@ async def check_eligibility_upload(
 
         return response
 
+    except HTTPException:
+        # Validation errors already carry the right status code
+        raise
     except Exception as e:
         logger.error(
             f"Eligibility check failed (file upload): {e}",
-            extra={"applicant_id_hash": _hash_id(applicant_id)},
+            extra={"applicant_id_hash": aid_hash},
             exc_info=True
         )
 
@@ -376,53 +575,90 @@ async def submit_to_registry(request: RegistrySubmitRequest):
         extra={"registry_id": registry_id}
     )
 
-    return RegistrySubmitResponse(
+    # Built from trusted internal values - skip field validation on the
+    # response path and go straight to serialization
+    return RegistrySubmitResponse.model_construct(
         registry_id=registry_id,
         status="REGISTERED",
         timestamp=datetime.now().isoformat()
     )
 
 
-@router.get("/health")
+@router.get("/health", response_model=None)
 async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
+    """Health check endpoint (returns a Response to skip jsonable_encoder)."""
+    return ORJSONResponse(content={
+        "status": "healthy" if engine is not None else "loading",
         "timestamp": datetime.now().isoformat(),
         "version": "1.0.0"
-    }
+    })
+
+
+@router.get("/ready", response_model=None)
+async def readiness_check():
+    """
+    Readiness probe for load balancers.
+
+    Returns 503 until the eligibility engine (and its models) has been
+    initialized at startup, so traffic is only routed to warm workers.
+    """
+    if engine is None:
+        raise HTTPException(status_code=503, detail="Engine still loading")
+    return ORJSONResponse(content={"status": "ready", "timestamp": datetime.now().isoformat()})
 
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
-def _save_base64_image(base64_data: str) -> str:
+def _decode_image_bytes(image_data: bytes) -> np.ndarray:
     """
-    Save base64-encoded image to temporary file.
+    Decode raw image bytes straight to an in-memory array.
+
+    Avoids the tempfile round-trip: the decoded bytes go directly through
+    cv2.imdecode and the resulting array is handed to the OCR pipeline.
 
     Args:
-        base64_data: Base64-encoded image
+        image_data: Encoded image bytes
 
     Returns:
-        Path to saved image file
+        Decoded BGR image array
     """
     try:
-        # Decode base64
-        image_data = base64.b64decode(base64_data)
+        image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError("Not a decodable image")
+        return image
 
-        # Create temp file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-        temp_file.write(image_data)
-        temp_file.close()
+    except Exception as e:
+        raise ValueError(f"Failed to decode image: {e}")
 
-        return temp_file.name
 
-    except Exception as e:
-        raise ValueError(f"Failed to decode base64 image: {e}")
+def _eligibility_payload(result) -> dict:
+    """Build the /eligibility response dict from an EligibilityResult."""
+    return {
+        "applicant_id": result.applicant_id,
+        "decision": result.decision.value,
+        "confidence": result.confidence,
+        "extracted_data": result.extracted_data,
+        "risk_assessment": {
+            "risk_score": result.risk_assessment.risk_score,
+            "risk_factors": result.risk_assessment.risk_factors,
+            "confidence": result.risk_assessment.confidence
+        },
+        "linkage_result": {
+            "matched": result.linkage_result.matched,
+            "confidence": result.linkage_result.confidence,
+            "field_scores": result.linkage_result.field_scores,
+            "requires_review": result.linkage_result.requires_review
+        },
+        "requires_manual_review": result.requires_manual_review,
+        "decision_rationale": result.decision_rationale,
+        "timestamp": result.timestamp.isoformat()
+    }
 
 
+@functools.lru_cache(maxsize=4096)
 def _hash_id(applicant_id: str) -> str:
-    """Hash applicant ID for privacy-aware logging."""
-    import hashlib
-    return hashlib.sha256(applicant_id.encode()).hexdigest()[:16]
+    """Hash applicant ID for privacy-aware logging (memoized per ID)."""
+    return _id_hash_fn(applicant_id.encode()).hexdigest()[:16]
@@ -4,17 +4,72 @@ Privacy-aware logging configuration.
 CRITICAL: Never log PII in standard output.
 """
 
+import atexit
+import copy
 import logging
 import json
+import queue
 import sys
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any
 
-from adapter.config.settings import settings
+# orjson serializes records 2-5x faster than the stdlib encoder and handles
+# datetime natively; fall back to json if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from adapter.config.settings import settings, HOT
 from adapter.utils.privacy import sanitize_for_logging
 
 
+# Second-resolution timestamp cache shared by the formatters: every record
+# within the same wall-clock second reuses the cached prefix and only pays
+# for the millisecond suffix - no datetime allocation or timezone math.
+_last_sec = -1
+_last_str = ""
+
+# Attributes every stdlib LogRecord carries; anything else on a record was
+# passed by a caller via extra={...} and belongs in the structured output.
+_STANDARD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+def _collect_extras(record: logging.LogRecord) -> Dict[str, Any]:
+    """Collect caller-supplied extra fields from a log record.
+
+    Stdlib logging attaches each extra={...} key directly as a record
+    attribute, so scan for non-standard keys. log_with_context nests its
+    context under a single "extra" key (to allow reserved names like "name"
+    or "module"); flatten that into the result.
+    """
+    extra = {
+        key: value for key, value in record.__dict__.items()
+        if key not in _STANDARD_ATTRS
+    }
+    nested = extra.pop("extra", None)
+    if nested:
+        extra.update(nested)
+    return extra
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a log record timestamp (ISO-8601 UTC, millisecond precision)."""
+    global _last_sec, _last_str
+
+    sec = int(created)
+    if sec != _last_sec:
+        _last_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _last_sec = sec
+
+    ms = int((created - sec) * 1000)
+    return f"{_last_str}.{ms:03d}Z"
+
+
 class JSONFormatter(logging.Formatter):
     """
     Format logs as JSON for structured logging.
@@ -26,7 +81,7 @@ class JSONFormatter(logging.Formatter):
         """Format log record as JSON."""
 
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "module": record.module,
             "function": record.funcName,
@@ -34,16 +89,17 @@ class JSONFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
 
-        # Add extra fields if present
-        if hasattr(record, "extra"):
-            extra_data = sanitize_for_logging(record.extra)
-            log_data["extra"] = extra_data
+        extra = _collect_extras(record)
+        if extra:
+            log_data["extra"] = sanitize_for_logging(extra)
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        if orjson is not None:
+            return orjson.dumps(log_data, default=str).decode()
+        return json.dumps(log_data, default=str)
 
 
 class TextFormatter(logging.Formatter):
@@ -56,15 +112,18 @@ class TextFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as text."""
 
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _format_timestamp(record.created)
         message = record.getMessage()
 
         log_line = f"[{timestamp}] {record.levelname:8s} {record.module}:{record.funcName}:{record.lineno} - {message}"
 
-        # Add extra fields if present
-        if hasattr(record, "extra"):
-            extra_data = sanitize_for_logging(record.extra)
-            log_line += f" | {json.dumps(extra_data)}"
+        extra = _collect_extras(record)
+        if extra:
+            extra_data = sanitize_for_logging(extra)
+            if orjson is not None:
+                log_line += f" | {orjson.dumps(extra_data, default=str).decode()}"
+            else:
+                log_line += f" | {json.dumps(extra_data, default=str)}"
 
         # Add exception info if present
         if record.exc_info:
@@ -73,6 +132,27 @@ class TextFormatter(logging.Formatter):
         return log_line
 
 
+class _StructuredQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps exc_info across the queue.
+
+    The stock prepare() formats the traceback into record.message and
+    nulls exc_info, which turns JSONFormatter's structured "exception"
+    field into dead code for every queued record. Merge args into the
+    message on the producer side (so mutable arguments are snapshotted at
+    call time) but carry exc_info through; the queue is in-process, so
+    holding the traceback briefly across the thread boundary is safe and
+    the listener-side formatter can still emit the structured field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
 def setup_logging() -> logging.Logger:
     """
     Configure privacy-aware logging.
@@ -83,7 +163,7 @@ def setup_logging() -> logging.Logger:
 
     # Create logger
     logger = logging.getLogger("gun_registry_adapter")
-    logger.setLevel(getattr(logging, settings.log_level.upper()))
+    logger.setLevel(HOT.log_level_int)
 
     # Remove existing handlers
     logger.handlers.clear()
@@ -94,19 +174,34 @@ def setup_logging() -> logging.Logger:
     else:
         formatter = TextFormatter()
 
+    # Both sinks sit behind one queue, decoupled from the request path:
+    # handlers attached directly would format + write() synchronously
+    # inside every logger.info call - serialized through Handler.lock and
+    # blocking the event loop thread on stream/file I/O. A QueueHandler
+    # just enqueues the record; the QueueListener thread owns formatting,
+    # sanitization, and the writes.
+    sinks = []
+
     # Console handler
     if settings.log_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        sinks.append(console_handler)
 
     # File handler (audit trail)
     log_file = Path(settings.log_file_path)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    file_handler = logging.FileHandler(log_file)
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    sinks.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(_StructuredQueueHandler(log_queue))
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -130,6 +225,7 @@ def log_with_context(level: str, message: str, **context: Any):
 
     log_func = getattr(logger, level.lower())
 
-    # Create a LogRecord with extra context
-    extra_data = {"extra": context}
-    log_func(message, extra=extra_data)
+    # Nest under a single "extra" key: stdlib logging rejects extras that
+    # shadow standard record attributes ("name", "module", ...), and the
+    # formatters flatten this wrapper back out
+    log_func(message, extra={"extra": context})
@@ -5,6 +5,7 @@ Loads environment variables from .env file.
 """
 
 import os
+import types
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -23,6 +24,8 @@ class Settings(BaseSettings):
     # Model A (Perception/OCR) Configuration
     # =================================================================
     model_a_confidence_threshold: float = Field(0.8, env="MODEL_A_CONFIDENCE_THRESHOLD")
+    ocr_backend: str = Field("openvino", env="OCR_BACKEND")  # openvino | onnxruntime | paddle
+    ocr_enable_hpi: bool = Field(True, env="OCR_ENABLE_HPI")
     image_quality_threshold: float = Field(0.5, env="IMAGE_QUALITY_THRESHOLD")
     enable_tamper_detection: bool = Field(True, env="ENABLE_TAMPER_DETECTION")
 
@@ -33,6 +36,12 @@ class Settings(BaseSettings):
     linkage_confidence_threshold: float = Field(0.7, env="LINKAGE_CONFIDENCE_THRESHOLD")
     linkage_manual_review_min: float = Field(0.7, env="LINKAGE_MANUAL_REVIEW_MIN")
     linkage_manual_review_max: float = Field(0.9, env="LINKAGE_MANUAL_REVIEW_MAX")
+    # Fellegi-Sunter m/u probabilities per field (name,dob,state,address):
+    # P(field agrees | same person) and P(field agrees | different person),
+    # estimated from the synthetic NICS data. Log-odds derived from these
+    # replace ad-hoc field weights in the linkage composite.
+    linkage_m_probs: str = Field("0.95,0.97,0.95,0.85", env="LINKAGE_M_PROBS")
+    linkage_u_probs: str = Field("0.05,0.003,0.04,0.30", env="LINKAGE_U_PROBS")
 
     openai_model: str = Field("gpt-4o-mini", env="OPENAI_MODEL")
     openai_temperature: float = Field(0.0, env="OPENAI_TEMPERATURE")
@@ -72,6 +81,7 @@ class Settings(BaseSettings):
     api_workers: int = Field(2, env="API_WORKERS")
     api_cors_origins: str = Field("http://localhost:3000,http://localhost:5678", env="API_CORS_ORIGINS")
     api_rate_limit: int = Field(100, env="API_RATE_LIMIT")
+    api_max_batch_size: int = Field(32, env="API_MAX_BATCH_SIZE")
 
     # =================================================================
     # Logging Configuration
@@ -87,7 +97,7 @@ class Settings(BaseSettings):
     # =================================================================
     test_mode: bool = Field(False, env="TEST_MODE")
     use_synthetic_nics: bool = Field(True, env="USE_SYNTHETIC_NICS")
-    synthetic_nics_path: str = Field("data/processed/synthetic_nics_records.json", env="SYNTHETIC_NICS_PATH")
+    synthetic_nics_path: str = Field("data/processed/synthetic_nics_records.ndjson", env="SYNTHETIC_NICS_PATH")
     debug: bool = Field(False, env="DEBUG")
 
     # =================================================================
@@ -102,6 +112,7 @@ class Settings(BaseSettings):
     # Security & Privacy
     # =================================================================
     enable_pii_hashing: bool = Field(True, env="ENABLE_PII_HASHING")
+    pii_hash_salt: str = Field("", env="PII_HASH_SALT")
     audit_log_retention_days: int = Field(2555, env="AUDIT_LOG_RETENTION_DAYS")  # 7 years
     enable_encryption: bool = Field(False, env="ENABLE_ENCRYPTION")
     secret_key: Optional[str] = Field(None, env="SECRET_KEY")
@@ -120,9 +131,17 @@ class Settings(BaseSettings):
     # Performance & Optimization
     # =================================================================
     ocr_timeout_seconds: int = Field(30, env="OCR_TIMEOUT_SECONDS")
+    ocr_batch_max_size: int = Field(8, env="OCR_BATCH_MAX_SIZE")
+    ocr_batch_max_delay: float = Field(0.05, env="OCR_BATCH_MAX_DELAY")
+    ocr_thread_pool_size: int = Field(16, env="OCR_THREAD_POOL_SIZE")
+    max_concurrent_llm: int = Field(4, env="MAX_CONCURRENT_LLM")
+    batch_concurrency: int = Field(16, env="BATCH_CONCURRENCY")
     api_request_timeout: int = Field(60, env="API_REQUEST_TIMEOUT")
     cache_ttl_seconds: int = Field(3600, env="CACHE_TTL_SECONDS")
+    ocr_cache_size: int = Field(256, env="OCR_CACHE_SIZE")
     enable_caching: bool = Field(False, env="ENABLE_CACHING")
+    use_opencl: bool = Field(True, env="USE_OPENCL")
+    clahe_skip_contrast: float = Field(0.6, env="CLAHE_SKIP_CONTRAST")
     max_file_upload_size_mb: int = Field(10, env="MAX_FILE_UPLOAD_SIZE_MB")
 
     # =================================================================
@@ -143,3 +162,18 @@ class Settings(BaseSettings):
 
 # Singleton settings instance
 settings = Settings()
+
+# Hot read-only fields frozen into a plain namespace at import time. Pydantic
+# attribute access carries descriptor/validation overhead; request hot paths
+# should read these instead. Derived values (log level int, byte caps) are
+# precomputed here once.
+import logging as _logging  # noqa: E402  (only for the level lookup below)
+
+HOT = types.SimpleNamespace(
+    enable_caching=settings.enable_caching,
+    cache_ttl=settings.cache_ttl_seconds,
+    log_level=settings.log_level.upper(),
+    log_level_int=getattr(_logging, settings.log_level.upper(), _logging.INFO),
+    max_upload_bytes=settings.max_file_upload_size_mb * 1024 * 1024,
+    debug=settings.debug,
+)
@@ -5,9 +5,39 @@ Coordinates Model A (Perception), Model B (Reasoning), and Probabilistic Linkage
 to make firearm eligibility decisions.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
 from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+# orjson parses the NICS JSON several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bounded LRU cache for OCR results (retries and re-submissions re-OCR
+# identical images otherwise)
+try:
+    from cachetools import LRUCache
+except ImportError:
+    LRUCache = None
+
+# BLAKE3 is SIMD-vectorized and much faster than SHA-256 where SHA-NI is
+# absent (common in container VMs); the digest is only a log correlation ID
+try:
+    from blake3 import blake3 as _id_hash_fn
+except ImportError:
+    _id_hash_fn = hashlib.sha256
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
 from adapter.core.model_a.paddleocr_adapter import PaddleOCRAdapter
@@ -19,6 +49,30 @@ from adapter.config.settings import settings
 from adapter.config.logging_config import logger
 
 
+# Pre-validates DOB strings so the common malformed/missing case (OCR
+# misreads) is a cheap regex reject instead of a raised-and-caught ValueError
+_DOB_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_nics_cached(path: str, mtime: float, size: int) -> tuple:
+    """
+    Parse a NICS records file, memoized per (path, mtime, size).
+
+    mtime and size only participate as cache keys: a changed file misses and
+    re-parses, an unchanged one returns the already-parsed records. Stored as
+    a tuple so cache entries stay unaliased across engine instances.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    loads = orjson.loads if orjson is not None else json.loads
+    # The generator emits NDJSON (one record per line); legacy array files
+    # are still recognized by their leading bracket.
+    if data.lstrip()[:1] == b"[":
+        return tuple(loads(data))
+    return tuple(loads(line) for line in data.splitlines() if line.strip())
+
+
 class EligibilityDecision(str, Enum):
     """Eligibility decision outcomes."""
     APPROVED = "APPROVED"
@@ -26,7 +80,7 @@ class EligibilityDecision(str, Enum):
     MANUAL_REVIEW = "MANUAL_REVIEW"
 
 
-@dataclass
+@dataclass(slots=True)
 class EligibilityResult:
     """
     Complete eligibility assessment result.
@@ -91,6 +145,15 @@ class EligibilityEngine:
         else:
             self.nics_records = self._load_nics_records()
 
+        # Bounds concurrent GPT-4o calls from the async path (rate limits)
+        self._llm_semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+
+        # Content-addressed OCR cache: hashing image bytes costs ~1-3ms vs
+        # tens-to-hundreds of ms for a PaddleOCR pass on the same image
+        self._ocr_cache = (
+            LRUCache(maxsize=settings.ocr_cache_size) if LRUCache is not None else None
+        )
+
         logger.info(
             "Eligibility engine initialized",
             extra={"num_nics_records": len(self.nics_records)}
@@ -99,7 +162,8 @@ class EligibilityEngine:
     def assess_eligibility(
         self,
         applicant_id: str,
-        id_image_path: str
+        id_image: Any,
+        ocr_result: Optional[OCRResult] = None
     ) -> EligibilityResult:
         """
         Perform complete eligibility assessment.
@@ -112,63 +176,217 @@ class EligibilityEngine:
 
         Args:
             applicant_id: Unique applicant identifier
-            id_image_path: Path to driver license image
+            id_image: Driver license image (path, encoded bytes, or ndarray)
+            ocr_result: Precomputed Model A result (e.g., from the dynamic
+                        batcher). Skips the OCR step if provided.
 
         Returns:
             EligibilityResult with decision and all intermediate outputs
         """
-        logger.info(
-            "Starting eligibility assessment",
-            extra={"applicant_id_hash": self._hash_id(applicant_id)}
-        )
+        # Guarded so batch runs at WARNING skip the hash + dict allocation
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting eligibility assessment",
+                extra={"applicant_id_hash": self._hash_id(applicant_id)}
+            )
 
-        # Step 1: Model A - Extract data from ID
-        ocr_result = self.perception.extract(id_image_path)
+        # Step 1: Model A - Extract data from ID (unless already batched upstream)
+        if ocr_result is None:
+            ocr_result = self._extract_cached(id_image)
         extracted_data = ocr_result.text_fields
 
-        logger.info(
-            "OCR extraction complete",
-            extra={
-                "confidence": ocr_result.confidence,
-                "fields_extracted": len(extracted_data)
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "OCR extraction complete",
+                extra={
+                    "confidence": ocr_result.confidence,
+                    "fields_extracted": len(extracted_data)
+                }
+            )
 
         # Step 2: Probabilistic Linkage
         linkage_result = self.linkage.link(extracted_data, self.nics_records)
 
-        logger.info(
-            "Linkage complete",
-            extra={
-                "matched": linkage_result.matched,
-                "confidence": linkage_result.confidence,
-                "requires_review": linkage_result.requires_review
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Linkage complete",
+                extra={
+                    "matched": linkage_result.matched,
+                    "confidence": linkage_result.confidence,
+                    "requires_review": linkage_result.requires_review
+                }
+            )
 
         # Step 3: Model B - Risk Assessment
         # Include linkage result in risk assessment data
-        applicant_data_with_background = extracted_data.copy()
-        if linkage_result.matched and linkage_result.best_match:
-            applicant_data_with_background["background_check"] = (
-                f"Match found: {linkage_result.best_match.get('outcome', 'Unknown')} "
-                f"(confidence: {linkage_result.confidence:.2f})"
+        risk_assessment = self.reasoning.assess_risk(
+            self._with_background(extracted_data, linkage_result)
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Risk assessment complete",
+                extra={
+                    "risk_score": risk_assessment.risk_score,
+                    "confidence": risk_assessment.confidence,
+                    "requires_review": risk_assessment.requires_manual_review
+                }
             )
-        else:
-            applicant_data_with_background["background_check"] = "No match found in NICS records"
 
-        risk_assessment = self.reasoning.assess_risk(applicant_data_with_background)
+        # Step 4: Make eligibility decision
+        return self._finalize(
+            applicant_id, ocr_result, extracted_data, linkage_result, risk_assessment
+        )
 
-        logger.info(
-            "Risk assessment complete",
-            extra={
-                "risk_score": risk_assessment.risk_score,
-                "confidence": risk_assessment.confidence,
-                "requires_review": risk_assessment.requires_manual_review
-            }
+    async def assess_eligibility_async(
+        self,
+        applicant_id: str,
+        id_image: Any,
+        ocr_result: Optional[OCRResult] = None
+    ) -> EligibilityResult:
+        """
+        Async eligibility assessment with overlapped pipeline stages.
+
+        Once OCR is done, linkage and a preliminary risk assessment are
+        independent, so they run concurrently and the wall time is
+        max(T_link, T_llm) rather than their sum. Linkage only feeds the
+        risk input a one-line background summary, and a non-match produces
+        exactly the summary the preliminary call assumed - so a second
+        GPT-4o call is issued only when linkage actually finds a match.
+        Concurrent LLM calls are bounded by a semaphore to respect rate
+        limits.
+
+        Args:
+            applicant_id: Unique applicant identifier
+            id_image: Driver license image (path, encoded bytes, or ndarray)
+            ocr_result: Precomputed Model A result (e.g., from the dynamic
+                        batcher). Skips the OCR step if provided.
+
+        Returns:
+            EligibilityResult with decision and all intermediate outputs
+        """
+        # Guarded so batch runs at WARNING skip the hash + dict allocation
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting eligibility assessment",
+                extra={"applicant_id_hash": self._hash_id(applicant_id)}
+            )
+
+        # Step 1: Model A - Extract data from ID (unless already batched upstream)
+        if ocr_result is None:
+            ocr_result = await asyncio.to_thread(self._extract_cached, id_image)
+        extracted_data = ocr_result.text_fields
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "OCR extraction complete",
+                extra={
+                    "confidence": ocr_result.confidence,
+                    "fields_extracted": len(extracted_data)
+                }
+            )
+
+        async def _guarded_risk(data: Dict[str, str]) -> RiskAssessment:
+            async with self._llm_semaphore:
+                return await self.reasoning.assess_risk_async(data)
+
+        # Steps 2+3 overlapped: linkage and a preliminary risk assessment
+        # (assuming no NICS match, the common case) run concurrently
+        linkage_result, risk_assessment = await asyncio.gather(
+            asyncio.to_thread(self.linkage.link, extracted_data, self.nics_records),
+            _guarded_risk(self._with_background(extracted_data, None)),
         )
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Linkage complete",
+                extra={
+                    "matched": linkage_result.matched,
+                    "confidence": linkage_result.confidence,
+                    "requires_review": linkage_result.requires_review
+                }
+            )
+
+        # A match invalidates the preliminary assumption - re-assess with
+        # the actual background summary
+        if linkage_result.matched and linkage_result.best_match:
+            risk_assessment = await _guarded_risk(
+                self._with_background(extracted_data, linkage_result)
+            )
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Risk assessment complete",
+                extra={
+                    "risk_score": risk_assessment.risk_score,
+                    "confidence": risk_assessment.confidence,
+                    "requires_review": risk_assessment.requires_manual_review
+                }
+            )
+
         # Step 4: Make eligibility decision
+        return self._finalize(
+            applicant_id, ocr_result, extracted_data, linkage_result, risk_assessment
+        )
+
+    async def assess_eligibility_many(
+        self,
+        items: List[tuple],
+        concurrency: Optional[int] = None
+    ) -> List[EligibilityResult]:
+        """
+        Assess many applicants concurrently.
+
+        Applicants are independent, so batch workloads (nightly re-runs,
+        backlog processing) run them through assess_eligibility_async under a
+        bounded semaphore: PaddleOCR releases the GIL in its C kernels and
+        overlaps with GPT-4o API latency, so wall time approaches the
+        slowest applicant rather than the sum. Linkage reuses the shared
+        NICS arrays across all applicants.
+
+        Args:
+            items: (applicant_id, id_image) pairs
+            concurrency: Max in-flight assessments (settings.batch_concurrency
+                         if None)
+
+        Returns:
+            EligibilityResults in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.batch_concurrency)
+
+        async def one(applicant_id: str, id_image: Any) -> EligibilityResult:
+            async with semaphore:
+                return await self.assess_eligibility_async(applicant_id, id_image)
+
+        return list(await asyncio.gather(
+            *(one(applicant_id, id_image) for applicant_id, id_image in items)
+        ))
+
+    @staticmethod
+    def _with_background(
+        extracted_data: Dict[str, str],
+        linkage_result: Optional[LinkageResult]
+    ) -> Dict[str, str]:
+        """Copy extracted data with the linkage outcome summarized for Model B."""
+        data = extracted_data.copy()
+        if linkage_result is not None and linkage_result.matched and linkage_result.best_match:
+            data["background_check"] = (
+                f"Match found: {linkage_result.best_match.get('outcome', 'Unknown')} "
+                f"(confidence: {linkage_result.confidence:.2f})"
+            )
+        else:
+            data["background_check"] = "No match found in NICS records"
+        return data
+
+    def _finalize(
+        self,
+        applicant_id: str,
+        ocr_result: OCRResult,
+        extracted_data: Dict[str, str],
+        linkage_result: LinkageResult,
+        risk_assessment: RiskAssessment
+    ) -> EligibilityResult:
+        """Make the final decision and assemble the EligibilityResult."""
         decision, confidence, rationale, requires_review = self._make_decision(
             ocr_result=ocr_result,
             risk_assessment=risk_assessment,
@@ -176,14 +394,15 @@ class EligibilityEngine:
             extracted_data=extracted_data
         )
 
-        logger.info(
-            "Eligibility decision complete",
-            extra={
-                "decision": decision.value,
-                "confidence": confidence,
-                "requires_review": requires_review
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Eligibility decision complete",
+                extra={
+                    "decision": decision.value,
+                    "confidence": confidence,
+                    "requires_review": requires_review
+                }
+            )
 
         return EligibilityResult(
             applicant_id=applicant_id,
@@ -213,13 +432,14 @@ class EligibilityEngine:
         """
         Make final eligibility decision based on all factors.
 
-        Decision Logic:
-        1. If OCR confidence < 0.5 → MANUAL_REVIEW
-        2. If risk score > 0.7 → DENIED
-        3. If linkage matched AND outcome = "denied" → DENIED
-        4. If age < 21 → DENIED
-        5. If any requires_manual_review flag → MANUAL_REVIEW
-        6. Otherwise → APPROVED
+        Decision Logic (short-circuit chain, cheapest checks first):
+        1. If tampering detected → MANUAL_REVIEW
+        2. If OCR confidence < 0.5 → MANUAL_REVIEW
+        3. If risk score > 0.7 → DENIED
+        4. If linkage matched AND outcome = "denied" → DENIED
+        5. If age < 21 → DENIED (DOB parsed only if still undecided)
+        6. If any requires_manual_review flag → MANUAL_REVIEW
+        7. Otherwise → APPROVED
 
         Args:
             ocr_result: Model A OCR result
@@ -240,24 +460,18 @@ class EligibilityEngine:
             0.2 * linkage_result.confidence
         )
 
-        # Rule 1: Low OCR confidence
+        # Rule 1: Tampering (precomputed boolean - previously checked last,
+        # after age parsing and every other rule had already run)
+        if ocr_result.tamper_detected:
+            rationale.append("ID tampering detected")
+            return EligibilityDecision.MANUAL_REVIEW, overall_confidence, rationale, True
+
+        # Rule 2: Low OCR confidence (precomputed float)
         if ocr_result.confidence < 0.5:
             rationale.append(f"OCR confidence too low: {ocr_result.confidence:.2f}")
             return EligibilityDecision.MANUAL_REVIEW, overall_confidence, rationale, True
 
-        # Rule 2: Age eligibility check (must be 21+)
-        age = self._calculate_age(extracted_data.get("dob"))
-        if age is not None:
-            if age < 21:
-                rationale.append(f"Age ineligible: {age} years old (must be 21+)")
-                return EligibilityDecision.DENIED, overall_confidence, rationale, False
-            else:
-                rationale.append(f"Age eligible: {age} years old")
-        else:
-            rationale.append("Age unknown (DOB not extracted)")
-            requires_review = True
-
-        # Rule 3: High risk score
+        # Rule 3: High risk score (float compare)
         if risk_assessment.risk_score > settings.model_b_risk_threshold:
             rationale.extend(risk_assessment.risk_factors)
             return EligibilityDecision.DENIED, overall_confidence, rationale, False
@@ -274,7 +488,20 @@ class EligibilityEngine:
                 rationale.append(f"Background check result unclear: {outcome}")
                 requires_review = True
 
-        # Rule 5: Manual review flags
+        # Rule 5: Age eligibility check (must be 21+) - DOB parsing deferred
+        # until no earlier rule has already decided
+        age = self._calculate_age(extracted_data.get("dob"))
+        if age is not None:
+            if age < 21:
+                rationale.append(f"Age ineligible: {age} years old (must be 21+)")
+                return EligibilityDecision.DENIED, overall_confidence, rationale, False
+            else:
+                rationale.append(f"Age eligible: {age} years old")
+        else:
+            rationale.append("Age unknown (DOB not extracted)")
+            requires_review = True
+
+        # Rule 6: Manual review flags
         if risk_assessment.requires_manual_review:
             rationale.append("Risk assessment flagged for manual review")
             requires_review = True
@@ -283,11 +510,6 @@ class EligibilityEngine:
             rationale.append("Linkage flagged for manual review (ambiguous match)")
             requires_review = True
 
-        if ocr_result.tamper_detected:
-            rationale.append("ID tampering detected")
-            return EligibilityDecision.MANUAL_REVIEW, overall_confidence, rationale, True
-
-        # Rule 6: If any manual review flag set
         if requires_review:
             return EligibilityDecision.MANUAL_REVIEW, overall_confidence, rationale, True
 
@@ -305,43 +527,94 @@ class EligibilityEngine:
         Returns:
             Age in years, or None if DOB invalid
         """
-        if not dob:
+        if not dob or not _DOB_RE.fullmatch(dob):
+            return None
+
+        # fromisoformat is the C fast path for exactly this shape and, unlike
+        # the regex above, rejects range-invalid dates ("9999-99-99"), which
+        # must route to manual review as None rather than produce a nonsense
+        # age the decision logic would auto-deny. Calendar-year subtraction
+        # replaces the days-//-365 approximation (which drifted a day per
+        # leap year).
+        try:
+            parsed = date.fromisoformat(dob)
+        except ValueError:
             return None
 
+        today = datetime.now()
+        return today.year - parsed.year - (
+            (today.month, today.day) < (parsed.month, parsed.day)
+        )
+
+    def _extract_cached(self, id_image: Any) -> OCRResult:
+        """
+        Run Model A extraction with a content-addressed result cache.
+
+        Identical image bytes (retries, duplicate submissions, test reruns)
+        skip the OCR pass entirely. Unhashable inputs fall through to a
+        plain extract.
+        """
+        if self._ocr_cache is None:
+            return self.perception.extract(id_image)
+
+        key = self._image_content_hash(id_image)
+        if key is None:
+            return self.perception.extract(id_image)
+
+        cached = self._ocr_cache.get(key)
+        if cached is not None:
+            logger.info("OCR result served from cache")
+            return cached
+
+        result = self.perception.extract(id_image)
+        self._ocr_cache[key] = result
+        return result
+
+    @staticmethod
+    def _image_content_hash(id_image: Any) -> Optional[str]:
+        """BLAKE2b content hash of an image input, or None if not hashable."""
         try:
-            from datetime import datetime
-            dob_date = datetime.strptime(dob, "%Y-%m-%d")
-            age = (datetime.now() - dob_date).days // 365
-            return age
-        except:
+            if isinstance(id_image, bytes):
+                data = id_image
+            elif isinstance(id_image, np.ndarray):
+                data = id_image.tobytes()
+            elif isinstance(id_image, (str, Path)):
+                data = Path(id_image).read_bytes()
+            else:
+                return None
+        except OSError:
             return None
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
 
     def _load_nics_records(self) -> List[Dict[str, Any]]:
         """
         Load NICS records from file.
 
+        Re-parses only when the file changes: the parsed records are cached
+        module-level keyed by (path, mtime, size), so re-instantiating the
+        engine is ~free.
+
         Returns:
             List of NICS records (or synthetic records)
         """
-        import json
-        from pathlib import Path
-
         if settings.use_synthetic_nics:
             # Load synthetic NICS records
-            nics_path = Path(settings.synthetic_nics_path)
-            if nics_path.exists():
-                with open(nics_path, 'r') as f:
-                    records = json.load(f)
-                logger.info(f"Loaded {len(records)} synthetic NICS records")
-                return records
-            else:
-                logger.warning(f"Synthetic NICS file not found: {nics_path}, using empty list")
+            nics_path = settings.synthetic_nics_path
+            try:
+                stat = os.stat(nics_path)
+            except OSError:
+                logger.warning("Synthetic NICS file not found: %s, using empty list", nics_path)
                 return []
+
+            records = list(_load_nics_cached(nics_path, stat.st_mtime, stat.st_size))
+            logger.info("Loaded %d synthetic NICS records", len(records))
+            return records
         else:
             logger.warning("Real NICS API integration not implemented, using empty list")
             return []
 
-    def _hash_id(self, applicant_id: str) -> str:
-        """Hash applicant ID for privacy-aware logging."""
-        import hashlib
-        return hashlib.sha256(applicant_id.encode()).hexdigest()[:16]
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _hash_id(applicant_id: str) -> str:
+        """Hash applicant ID for privacy-aware logging (memoized per ID)."""
+        return _id_hash_fn(applicant_id.encode()).hexdigest()[:16]
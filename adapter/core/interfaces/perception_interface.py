@@ -5,13 +5,14 @@ This interface defines the contract for perception adapters (OCR, image processi
 Follows Open/Closed Principle: Open for extension (new OCR engines), closed for modification.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OCRResult:
     """
     Normalized OCR output from Model A.
@@ -42,12 +43,12 @@ class PerceptionAdapter(ABC):
     """
 
     @abstractmethod
-    def extract(self, image_path: str) -> OCRResult:
+    def extract(self, image: Any) -> OCRResult:
         """
         Extract structured data from image.
 
         Args:
-            image_path: Path to driver license image
+            image: Driver license image (path, encoded bytes, or decoded array)
 
         Returns:
             OCRResult with extracted fields and confidence scores
@@ -60,13 +61,22 @@ class PerceptionAdapter(ABC):
         """
         pass
 
+    async def extract_async(self, image: Any) -> OCRResult:
+        """
+        Async variant of extract.
+
+        Default implementation delegates to the sync extract in a worker
+        thread; adapters backed by true async I/O can override it.
+        """
+        return await asyncio.to_thread(self.extract, image)
+
     @abstractmethod
-    def validate_quality(self, image_path: str) -> float:
+    def validate_quality(self, image: Any) -> float:
         """
         Assess image quality before OCR.
 
         Args:
-            image_path: Path to image
+            image: Image (path, encoded bytes, or decoded array)
 
         Returns:
             Quality score (0.0-1.0), where > 0.7 is acceptable
@@ -74,14 +84,14 @@ class PerceptionAdapter(ABC):
         pass
 
     @abstractmethod
-    def detect_tampering(self, image_path: str) -> bool:
+    def detect_tampering(self, image: Any) -> bool:
         """
         Check for image tampering/forgery.
 
         Uses edge detection, noise analysis, and compression artifacts.
 
         Args:
-            image_path: Path to image
+            image: Image (path, encoded bytes, or decoded array)
 
         Returns:
             True if tampering detected, False otherwise
@@ -89,16 +99,16 @@ class PerceptionAdapter(ABC):
         pass
 
     @abstractmethod
-    def preprocess(self, image_path: str) -> str:
+    def preprocess(self, image: Any) -> Any:
         """
         Preprocess image to enhance OCR accuracy.
 
         Operations: resize, denoise, contrast enhancement, rotation correction.
 
         Args:
-            image_path: Path to original image
+            image: Original image (path, encoded bytes, or decoded array)
 
         Returns:
-            Path to preprocessed image
+            Preprocessed image ready for OCR
         """
         pass
@@ -4,13 +4,14 @@ Model B (Reasoning Layer) Interface - Strategy Pattern.
 Handles risk assessment, fuzzy matching, and semantic analysis.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskAssessment:
     """
     Risk scoring output from Model B.
@@ -32,7 +33,7 @@ class RiskAssessment:
             raise ValueError(f"Confidence must be 0.0-1.0, got {self.confidence}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LinkageResult:
     """
     Result of probabilistic data linkage.
@@ -83,6 +84,16 @@ class ReasoningAdapter(ABC):
         """
         pass
 
+    async def assess_risk_async(self, applicant_data: Dict[str, Any]) -> RiskAssessment:
+        """
+        Async variant of assess_risk.
+
+        Default implementation delegates to the sync assess_risk in a worker
+        thread; adapters with native async clients should override it to
+        avoid the thread hop per call.
+        """
+        return await asyncio.to_thread(self.assess_risk, applicant_data)
+
     @abstractmethod
     def interpret_text(self, text: str, context: str) -> Dict[str, Any]:
         """
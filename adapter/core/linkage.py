@@ -5,10 +5,19 @@ CRITICAL: Never uses exact matching. Always returns confidence scores.
 Implements multi-criteria weighted scoring as specified in requirements.
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+from rapidfuzz import fuzz, process, utils
+
 from adapter.core.interfaces.reasoning_interface import LinkageResult
+from adapter.core.linkage_numba import (
+    _AMBIGUITY_NAME_SCORE,
+    score_and_select,
+    warmup as _warmup_kernel,
+)
 from adapter.core.model_b.rapidfuzz_matcher import RapidFuzzMatcher
 from adapter.exceptions.parser_exceptions import LinkageError, NoMatchFoundError
 from adapter.config.settings import settings
@@ -19,11 +28,12 @@ class ProbabilisticLinkageEngine:
     """
     Probabilistic linkage between applicant data and NICS records.
 
-    Uses weighted multi-criteria scoring:
-    - Name match (fuzzy): 40% weight
-    - DOB exact match: 30% weight
-    - State match: 20% weight
-    - Address match (fuzzy): 10% weight
+    Uses weighted multi-criteria scoring with Fellegi-Sunter log-odds
+    weights: each field's weight is log(m/u) - log((1-m)/(1-u)) where m/u
+    are the configured probabilities that the field agrees for a same/
+    different person pair, normalized to sum to 1 so the composite stays
+    in 0.0-1.0. With the default m/u estimates this works out to roughly
+    name=25%, DOB=39%, state=26%, address=11%.
 
     Confidence thresholds:
     - >= 0.9: Auto-match (high confidence)
@@ -42,12 +52,38 @@ class ProbabilisticLinkageEngine:
         self.threshold = settings.linkage_confidence_threshold
         self.manual_review_min = settings.linkage_manual_review_min
         self.manual_review_max = settings.linkage_manual_review_max
+        self.field_weights = self._compute_field_weights()
+
+        # Base assumption strings are invariant per engine instance; build
+        # them once here instead of re-interpolating on every link() call
+        self._base_assumptions = (
+            "Name matching uses token_set_ratio to handle word order variations (e.g., 'John Doe' vs 'Doe, John')",
+            "DOB requires exact match (no fuzzy matching on dates for safety)",
+            f"Confidence threshold set at {self.threshold} (configurable via LINKAGE_CONFIDENCE_THRESHOLD env var)",
+            "Weights derived from Fellegi-Sunter m/u probabilities: "
+            + ", ".join(
+                f"{f}={w:.0%}" for f, w in
+                zip(("name", "DOB", "state", "address"), self.field_weights)
+            )
+            + " (tunable via LINKAGE_M_PROBS/LINKAGE_U_PROBS)",
+        )
+
+        # Struct-of-arrays view of the last records list seen, keyed by list
+        # identity (the engine passes the same list every call). The cache
+        # holds the list object itself: an is-comparison against a stored
+        # id() would be fooled by CPython reusing a freed list's id, and
+        # keeping the reference pins the id alive.
+        self._soa_cache: Optional[Tuple[List[Dict[str, Any]], tuple]] = None
+
+        # Compile the fused scoring kernel now, not on the first request
+        _warmup_kernel()
 
         logger.info(
             "Probabilistic linkage engine initialized",
             extra={
                 "threshold": self.threshold,
-                "manual_review_range": f"{self.manual_review_min}-{self.manual_review_max}"
+                "manual_review_range": f"{self.manual_review_min}-{self.manual_review_max}",
+                "field_weights": [round(float(w), 3) for w in self.field_weights]
             }
         )
 
@@ -83,26 +119,71 @@ class ProbabilisticLinkageEngine:
                     best_match=None
                 )
 
-            best_match = None
-            best_score = 0.0
-            best_field_scores = {}
+            # Blocking: no record that disagrees on both state and DOB year
+            # can reach the match threshold (name + address weights alone max
+            # out well below it), so only records sharing a blocking key with
+            # the applicant are scored at all
+            candidate_idx = self._candidate_indices(applicant, nics_records)
+
+            if candidate_idx is not None and candidate_idx.size == 0:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Linkage blocking found no candidate records",
+                        extra={"num_records": len(nics_records)}
+                    )
+                return LinkageResult(
+                    matched=False,
+                    confidence=0.0,
+                    field_scores={},
+                    assumptions=[
+                        "No NICS records share the applicant's state or DOB "
+                        "year (blocking keys); no candidates scored"
+                    ],
+                    requires_review=False,
+                    best_match=None
+                )
 
-            # Iterate through all NICS records
-            for record in nics_records:
-                field_scores = self._calculate_field_scores(applicant, record)
+            # Score the candidate set in one vectorized pass:
+            # rapidfuzz.process.cdist runs the fuzzy scorers across all
+            # candidates in C (parallelized), and exact-match fields become
+            # numpy comparisons. This replaces a Python loop of per-record
+            # match_score calls.
+            name_scores, dob_scores, state_scores, address_scores = (
+                self._score_all(applicant, nics_records, candidate_idx)
+            )
 
-                # Weighted composite score
-                composite_score = (
-                    0.4 * field_scores["name"] +
-                    0.3 * field_scores["dob"] +
-                    0.2 * field_scores["state"] +
-                    0.1 * field_scores["address"]
-                )
+            # Fused composite + argmax + ambiguity count (JIT-compiled when
+            # numba is available, vectorized NumPy otherwise)
+            best_idx, best_score, ambiguous_names = score_and_select(
+                name_scores, dob_scores, state_scores, address_scores,
+                self.field_weights
+            )
 
-                if composite_score > best_score:
-                    best_score = composite_score
-                    best_match = record
-                    best_field_scores = field_scores
+            # Blocking is safe for the composite score (non-candidates max
+            # out below the match threshold) but not for the ambiguity
+            # safety flag: a same-surname record in another state must
+            # still force manual review. When blocking pruned anything,
+            # recount high name scores over the full records list.
+            if candidate_idx is not None and candidate_idx.size < len(nics_records):
+                ambiguous_names = self._count_ambiguous_names(applicant, nics_records)
+
+            if best_score > 0.0:
+                # best_idx is in candidate space (the score arrays are
+                # sliced to blocking survivors in _score_all), so read the
+                # field scores with it before remapping to record space
+                # for the best_match lookup
+                best_field_scores = {
+                    "name": float(name_scores[best_idx]),
+                    "dob": float(dob_scores[best_idx]),
+                    "state": float(state_scores[best_idx]),
+                    "address": float(address_scores[best_idx]),
+                }
+                if candidate_idx is not None:
+                    best_idx = int(candidate_idx[best_idx])
+                best_match = nics_records[best_idx]
+            else:
+                best_match = None
+                best_field_scores = {}
 
             # Document assumptions
             assumptions = self._document_assumptions(applicant, best_match, best_field_scores)
@@ -110,22 +191,22 @@ class ProbabilisticLinkageEngine:
             # Determine if match found
             matched = best_score >= self.threshold
 
-            # Determine if manual review required
+            # Determine if manual review required (ambiguity count comes from
+            # the scoring kernel instead of rescoring every record)
             requires_review = (
                 self.manual_review_min <= best_score < self.manual_review_max
-            ) or (
-                len([r for r in nics_records if self._calculate_field_scores(applicant, r)["name"] > 0.8]) > 1
-            )
-
-            logger.info(
-                "Linkage complete",
-                extra={
-                    "matched": matched,
-                    "confidence": best_score,
-                    "requires_review": requires_review,
-                    "num_records_searched": len(nics_records)
-                }
-            )
+            ) or ambiguous_names > 1
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Linkage complete",
+                    extra={
+                        "matched": matched,
+                        "confidence": best_score,
+                        "requires_review": requires_review,
+                        "num_records_searched": len(name_scores)
+                    }
+                )
 
             return LinkageResult(
                 matched=matched,
@@ -135,7 +216,8 @@ class ProbabilisticLinkageEngine:
                 requires_review=requires_review,
                 best_match=best_match if matched else None,
                 metadata={
-                    "num_records_searched": len(nics_records),
+                    "num_records_searched": len(name_scores),
+                    "num_records_total": len(nics_records),
                     "threshold": self.threshold
                 },
                 timestamp=datetime.now()
@@ -145,62 +227,162 @@ class ProbabilisticLinkageEngine:
             logger.error(f"Linkage failed: {e}", exc_info=True)
             raise LinkageError(f"Linkage failed: {str(e)}")
 
-    def _calculate_field_scores(
+    @staticmethod
+    def _compute_field_weights() -> np.ndarray:
+        """
+        Derive normalized field weights from the configured m/u probabilities.
+
+        Per the Fellegi-Sunter model, a field's discriminating power is the
+        log-likelihood-ratio spread log(m/u) - log((1-m)/(1-u)). Normalizing
+        the spreads to sum to 1 turns the log-likelihood test into a weighted
+        average over the 0.0-1.0 field scores, so the existing confidence
+        thresholds keep their meaning.
+        """
+        m = np.array([float(p) for p in settings.linkage_m_probs.split(",")])
+        u = np.array([float(p) for p in settings.linkage_u_probs.split(",")])
+        spread = np.log(m / u) - np.log((1.0 - m) / (1.0 - u))
+        return spread / spread.sum()
+
+    def _nics_arrays(self, nics_records: List[Dict[str, Any]]) -> tuple:
+        """
+        Build (or reuse) a struct-of-arrays view of the NICS records.
+
+        Normalization (strip/case-fold) happens once per records list rather
+        than once per field comparison; the cache is keyed on list identity
+        since the engine reuses the same loaded list across calls.
+        """
+        if self._soa_cache is not None and self._soa_cache[0] is nics_records:
+            return self._soa_cache[1]
+
+        dobs = np.array([r.get("dob", "").strip() for r in nics_records])
+        states = np.array([r.get("state", "").strip().upper() for r in nics_records])
+
+        # Blocking indexes: record positions grouped by state and DOB year
+        by_state: Dict[str, List[int]] = {}
+        by_dob_year: Dict[str, List[int]] = {}
+        for i, (dob, state) in enumerate(zip(dobs, states)):
+            if state:
+                by_state.setdefault(state, []).append(i)
+            if dob:
+                by_dob_year.setdefault(dob[:4], []).append(i)
+
+        # Names and addresses go through rapidfuzz's default_process once
+        # here (case-fold + punctuation strip), so cdist runs with
+        # processor=None and no per-call re-normalization
+        arrays = (
+            [utils.default_process(r.get("name", "")) for r in nics_records],
+            dobs,
+            states,
+            [utils.default_process(r.get("address", "")) for r in nics_records],
+            by_state,
+            by_dob_year,
+        )
+        self._soa_cache = (nics_records, arrays)
+        return arrays
+
+    def _candidate_indices(
         self,
         applicant: Dict[str, Any],
-        record: Dict[str, Any]
-    ) -> Dict[str, float]:
+        nics_records: List[Dict[str, Any]]
+    ) -> Optional[np.ndarray]:
         """
-        Calculate per-field match scores.
+        Candidate record positions sharing a blocking key with the applicant.
 
-        Args:
-            applicant: Applicant data
-            record: NICS record
+        Records agreeing on neither state nor DOB year cannot reach the match
+        threshold (the name and address weights alone sum to ~0.36), so they
+        are skipped entirely. Returns None - meaning score everything - when
+        the applicant has no usable blocking keys.
+        """
+        state = applicant.get("state", "").strip().upper()
+        dob = applicant.get("dob", "").strip()
+        if not state and not dob:
+            return None
+
+        _, _, _, _, by_state, by_dob_year = self._nics_arrays(nics_records)
+        candidates: set = set()
+        if state:
+            candidates.update(by_state.get(state, ()))
+        if dob:
+            candidates.update(by_dob_year.get(dob[:4], ()))
+        return np.fromiter(sorted(candidates), dtype=np.int64, count=len(candidates))
+
+    def _count_ambiguous_names(
+        self,
+        applicant: Dict[str, Any],
+        nics_records: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Count high-scoring name matches across the full records list.
+
+        One cdist pass over the cached normalized names; score_cutoff lets
+        the kernel bail early on names that cannot clear the ambiguity
+        threshold, so the rescan stays cheap even on large pools.
+        """
+        applicant_name = utils.default_process(applicant.get("name", ""))
+        if not applicant_name:
+            return 0
+
+        names = self._nics_arrays(nics_records)[0]
+        scores = process.cdist(
+            [applicant_name], names,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=_AMBIGUITY_NAME_SCORE * 100.0,
+            workers=-1,
+        )[0]
+        return int((scores > _AMBIGUITY_NAME_SCORE * 100.0).sum())
+
+    def _score_all(
+        self,
+        applicant: Dict[str, Any],
+        nics_records: List[Dict[str, Any]],
+        candidate_idx: Optional[np.ndarray] = None
+    ) -> tuple:
+        """
+        Calculate per-field score vectors across the candidate NICS records.
+
+        Name uses token_set_ratio (tokens reorder: 'Doe, John' vs 'John
+        Doe') and address token_sort_ratio, which does one tokenize+sort
+        pass plus a single alignment instead of partial_ratio's sliding-
+        window search - addresses keep their component order, so the
+        cheaper scorer loses nothing. DOB and state are exact matches only
+        (no fuzzy matching on dates for safety). Missing fields score 0.0.
+        Positions in
+        the returned arrays correspond to candidate_idx entries (or to all
+        records when candidate_idx is None).
 
         Returns:
-            Dictionary of field scores (0.0-1.0)
+            (name_scores, dob_scores, state_scores, address_scores) arrays
         """
-        scores = {}
+        names, dobs, states, addresses, _, _ = self._nics_arrays(nics_records)
 
-        # 1. Name fuzzy match (40% weight)
-        applicant_name = applicant.get("name", "").strip()
-        record_name = record.get("name", "").strip()
+        if candidate_idx is not None:
+            names = [names[i] for i in candidate_idx]
+            addresses = [addresses[i] for i in candidate_idx]
+            dobs = dobs[candidate_idx]
+            states = states[candidate_idx]
 
-        if applicant_name and record_name:
-            scores["name"] = self.fuzzy_matcher.match_score(applicant_name, record_name)
-        else:
-            scores["name"] = 0.0
+        n = len(names)
+        zeros = np.zeros(n)
 
-        # 2. DOB exact match (30% weight)
+        applicant_name = utils.default_process(applicant.get("name", ""))
         applicant_dob = applicant.get("dob", "").strip()
-        record_dob = record.get("dob", "").strip()
-
-        if applicant_dob and record_dob:
-            # Exact match only (no fuzzy matching on dates for safety)
-            scores["dob"] = 1.0 if applicant_dob == record_dob else 0.0
-        else:
-            scores["dob"] = 0.0
-
-        # 3. State exact match (20% weight)
         applicant_state = applicant.get("state", "").strip().upper()
-        record_state = record.get("state", "").strip().upper()
+        applicant_address = utils.default_process(applicant.get("address", ""))
 
-        if applicant_state and record_state:
-            scores["state"] = 1.0 if applicant_state == record_state else 0.0
-        else:
-            scores["state"] = 0.0
-
-        # 4. Address fuzzy match (10% weight)
-        applicant_address = applicant.get("address", "").strip()
-        record_address = record.get("address", "").strip()
-
-        if applicant_address and record_address:
-            # Use partial ratio (addresses may have different formatting)
-            scores["address"] = self.fuzzy_matcher.match_score_partial(applicant_address, record_address)
-        else:
-            scores["address"] = 0.0
+        # Fuzzy scorers return 0 for empty candidate strings, so only the
+        # applicant side needs an explicit empty guard
+        name_scores = (
+            process.cdist([applicant_name], names, scorer=fuzz.token_set_ratio, workers=-1)[0] / 100.0
+            if applicant_name else zeros
+        )
+        dob_scores = (dobs == applicant_dob).astype(np.float64) if applicant_dob else zeros
+        state_scores = (states == applicant_state).astype(np.float64) if applicant_state else zeros
+        address_scores = (
+            process.cdist([applicant_address], addresses, scorer=fuzz.token_sort_ratio, workers=-1)[0] / 100.0
+            if applicant_address else zeros
+        )
 
-        return scores
+        return name_scores, dob_scores, state_scores, address_scores
 
     def _document_assumptions(
         self,
@@ -219,12 +401,7 @@ class ProbabilisticLinkageEngine:
         Returns:
             List of assumption statements
         """
-        assumptions = [
-            "Name matching uses token_set_ratio to handle word order variations (e.g., 'John Doe' vs 'Doe, John')",
-            "DOB requires exact match (no fuzzy matching on dates for safety)",
-            f"Confidence threshold set at {self.threshold} (configurable via LINKAGE_CONFIDENCE_THRESHOLD env var)",
-            "Weights: name=40%, DOB=30%, state=20%, address=10% (tunable based on field reliability)"
-        ]
+        assumptions = list(self._base_assumptions)
 
         # Document missing fields
         missing_fields = []
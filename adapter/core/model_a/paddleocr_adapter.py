@@ -6,8 +6,14 @@ Implements PerceptionAdapter interface (Open/Closed Principle).
 """
 
 import cv2
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from typing import Dict, Any, Optional
+from collections import namedtuple
+from typing import Dict, Any, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import re
@@ -23,6 +29,252 @@ from adapter.config.settings import settings
 from adapter.config.logging_config import logger
 
 
+# Accepted image inputs: path on disk, raw encoded bytes, or a decoded array
+ImageInput = Union[str, bytes, np.ndarray]
+
+# Decoded image plus the derived analysis arrays every extract() stage needs
+ImageTriplet = namedtuple("ImageTriplet", ["bgr", "gray", "laplacian", "var_scale"])
+
+# Above this grayscale height, quality/tamper analysis runs on a half-size
+# copy; blur variance is scale-corrected and the other signals (contrast,
+# brightness, edge density) are effectively scale-invariant
+_ANALYSIS_MAX_HEIGHT = 1200
+
+
+def _analysis_arrays(gray: np.ndarray) -> tuple:
+    """
+    (analysis_gray, laplacian, var_scale) for quality/tamper checks.
+
+    Large scans are halved with INTER_AREA first - the blur/contrast/edge
+    signals survive moderate downscaling, and the Laplacian + reductions
+    then touch a quarter of the pixels. Laplacian variance shrinks roughly
+    with the square of the scale factor, so var_scale compensates.
+    """
+    if gray.shape[0] >= _ANALYSIS_MAX_HEIGHT:
+        small = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        return small, cv2.Laplacian(small, cv2.CV_32F, ksize=3), 4.0
+    return gray, cv2.Laplacian(gray, cv2.CV_32F, ksize=3), 1.0
+
+
+@functools.lru_cache(maxsize=32)
+def _load_triplet(path: str, mtime: float) -> Optional[ImageTriplet]:
+    """
+    Decode an on-disk image and derive its analysis arrays.
+
+    LRU-cached on (path, mtime) so retries and Model C self-healing replays
+    of the same file skip the JPEG decode entirely; an edited file gets a
+    new mtime and therefore a fresh entry. Tests can reset via
+    _load_triplet.cache_clear().
+    """
+    bgr = cv2.imread(path)
+    if bgr is None:
+        return None
+    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    analysis_gray, laplacian, var_scale = _analysis_arrays(gray)
+    return ImageTriplet(bgr, analysis_gray, laplacian, var_scale)
+
+
+# License-field patterns compiled once at import time; _parse_driver_license
+# runs per image, so inline re.search literals would re-hit the re module's
+# bounded cache on every record.
+_NAME_RE = re.compile(r'(?:NAME|LN)\s*[:;]?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE)
+_NAME_FALLBACK_RE = re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+_DOB_RE = re.compile(r'(?:DOB|DATE OF BIRTH)\s*[:;]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_DOB_FALLBACK_RE = re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{4}-\d{2}-\d{2})')
+_STATE_RE = re.compile(r'\b([A-Z]{2})\b')
+_LICENSE_RE = re.compile(r'(?:DL|LIC|LICENSE)\s*#?\s*[:;]?\s*([A-Z0-9]{6,15})', re.IGNORECASE)
+_LICENSE_FALLBACK_RE = re.compile(r'\b([A-Z0-9]{8,12})\b')
+_ADDRESS_RE = re.compile(
+    r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way)'
+    r'[,\s]+[A-Za-z\s]+,?\s*[A-Z]{2}\s+\d{5})',
+    re.IGNORECASE,
+)
+
+# Date shapes handled by _normalize_date: ISO-style year-first, and
+# US/European day-month pairs disambiguated by field value
+_ISO_DATE_RE = re.compile(r'^(\d{4})[-/](\d{1,2})[-/](\d{1,2})$')
+_DMY_OR_MDY_RE = re.compile(r'^(\d{1,2})[/-](\d{1,2})[/-](\d{4})$')
+
+
+def _decode_image(image: ImageInput) -> Optional[np.ndarray]:
+    """Decode an image input (path, raw bytes, or ndarray) to a BGR array."""
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, bytes):
+        return cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_COLOR)
+    return cv2.imread(str(image))
+
+
+def _quality_metrics(
+    gray: np.ndarray,
+    laplacian: Optional[np.ndarray] = None,
+    var_scale: float = 1.0,
+) -> tuple:
+    """(quality, contrast_score) from a precomputed grayscale array."""
+    try:
+        # 1. Blur detection (Laplacian variance)
+        if laplacian is None:
+            laplacian = cv2.Laplacian(gray, cv2.CV_32F, ksize=3)
+        # meanStdDev fuses the reduction in OpenCV's SIMD backend; FP32
+        # halves the bandwidth of the old CV_64F buffer + ndarray.var().
+        _, stddev = cv2.meanStdDev(laplacian)
+        laplacian_var = float(stddev[0, 0]) ** 2 * var_scale
+        # Normalize: higher variance = sharper image
+        blur_score = min(laplacian_var / 1000.0, 1.0)  # Typical sharp images have var > 500
+
+        # 2+3. Contrast and brightness from one fused reduction over the
+        # grayscale buffer (two ndarray passes become a single SIMD one)
+        mean, gray_stddev = cv2.meanStdDev(gray)
+        contrast = float(gray_stddev[0, 0]) / 128.0  # Normalize by half of grayscale range
+        contrast_score = min(contrast, 1.0)
+
+        # Brightness (avoid over/under exposure)
+        brightness = float(mean[0, 0]) / 255.0
+        # Ideal brightness: 0.3-0.7 range
+        if 0.3 <= brightness <= 0.7:
+            brightness_score = 1.0
+        else:
+            brightness_score = max(0.0, 1.0 - abs(brightness - 0.5) * 2)
+
+        # Weighted average
+        quality = (
+            0.5 * blur_score +
+            0.3 * contrast_score +
+            0.2 * brightness_score
+        )
+
+        return quality, contrast_score
+
+    except Exception as e:
+        logger.warning(f"Quality validation failed: {e}")
+        return 0.0, 0.0
+
+
+def _quality_score(gray: np.ndarray, laplacian: Optional[np.ndarray] = None) -> float:
+    """Quality score (0.0-1.0) from a precomputed grayscale array."""
+    return _quality_metrics(gray, laplacian)[0]
+
+
+def _tamper_check(gray: np.ndarray, laplacian: Optional[np.ndarray] = None) -> bool:
+    """Tamper heuristics on a precomputed grayscale array."""
+    try:
+        # 1. Edge discontinuities (tampered images often have irregular edges)
+        edges = cv2.Canny(gray, 50, 150)
+        # countNonZero: one SIMD pass, no temporary bool array
+        edge_density = cv2.countNonZero(edges) / edges.size
+
+        # Typical driver licenses have consistent edge density (0.05-0.15)
+        if edge_density < 0.02 or edge_density > 0.25:
+            logger.warning(f"Suspicious edge density: {edge_density:.3f}")
+            return True
+
+        # 2. Noise analysis (JPEG compression artifacts)
+        # High-frequency energy via the 3x3 Laplacian (one small fixed
+        # stencil, shared with blur scoring) rather than a full-image FFT;
+        # the abs-mean over a center crop tracks the same noise signal.
+        if laplacian is None:
+            laplacian = cv2.Laplacian(gray, cv2.CV_32F, ksize=3)
+        h, w = laplacian.shape
+        center = laplacian[h // 4: 3 * h // 4, w // 4: 3 * w // 4]
+        high_freq_noise = float(np.mean(np.abs(center)))
+
+        # Threshold re-tuned against the synthetic card corpus; clean
+        # compressed scans sit well below this abs-mean energy.
+        if high_freq_noise > 40.0:
+            logger.warning(f"Suspicious high-frequency noise: {high_freq_noise:.1f}")
+            return True
+
+        return False
+
+    except Exception as e:
+        logger.warning(f"Tamper detection failed: {e}")
+        return False  # Fail open (don't reject image on detection failure)
+
+
+def _enhance_gray(gray, height: int, width: int, contrast_score: Optional[float] = None):
+    """Denoise + CLAHE + resize; works on ndarray or UMat inputs."""
+    # Denoise. Edge-preserving bilateral filter on the single grayscale
+    # channel; non-local means on the color image was by far the most
+    # expensive op in the pipeline for marginal OCR gain on clean
+    # licenses (CLAHE below is the main enhancer).
+    enhanced = cv2.bilateralFilter(gray, d=5, sigmaColor=35, sigmaSpace=35)
+
+    # Contrast enhancement (CLAHE - Contrast Limited Adaptive Histogram
+    # Equalization). Skipped when quality scoring already measured good
+    # contrast: the per-tile histogram + LUT pass buys nothing on
+    # well-lit inputs.
+    if contrast_score is None or contrast_score <= settings.clahe_skip_contrast:
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        enhanced = clahe.apply(enhanced)
+
+    # Rotation correction (basic - check if text is rotated)
+    # This is simplified - production would use more sophisticated deskewing
+
+    # Resize to standard dimensions (if too small)
+    if width < 800 or height < 600:
+        scale = max(800 / width, 600 / height)
+        new_width = int(width * scale)
+        new_height = int(height * scale)
+        enhanced = cv2.resize(enhanced, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
+
+    return enhanced
+
+
+def _preprocess_array(image: np.ndarray, contrast_score: Optional[float] = None) -> np.ndarray:
+    """Enhance a decoded BGR array for OCR (denoise, CLAHE, resize)."""
+    try:
+        # 1. Convert to grayscale for processing
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        height, width = gray.shape
+
+        # 2. Offload the filter chain through the T-API when an OpenCL
+        # device is present; the same calls run on UMat transparently and
+        # this is a no-op on CPU-only builds.
+        if settings.use_opencl and cv2.ocl.haveOpenCL():
+            try:
+                return _enhance_gray(cv2.UMat(gray), height, width, contrast_score).get()
+            except cv2.error as e:
+                logger.warning(f"OpenCL preprocessing failed, falling back to CPU: {e}")
+
+        return _enhance_gray(gray, height, width, contrast_score)
+
+    except Exception as e:
+        logger.warning(f"Preprocessing failed: {e}, using original image")
+        return image
+
+
+def _prepare_arrays(image: ImageInput) -> tuple:
+    """
+    Decode one image and run the CPU-side pipeline stages.
+
+    Module-level (and exception-free) so it is picklable into the
+    preprocessing process pool used by extract_batch; the caller applies
+    quality/tamper policy and raises the adapter exceptions.
+
+    Returns:
+        (preprocessed_or_None, quality, tamper_detected, decode_ok)
+    """
+    triplet = None
+    if isinstance(image, (str, Path)) and os.path.isfile(image):
+        triplet = _load_triplet(str(image), os.path.getmtime(image))
+    if triplet is None:
+        bgr = _decode_image(image)
+        if bgr is None:
+            return None, 0.0, False, False
+        gray, laplacian, var_scale = _analysis_arrays(cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+    else:
+        bgr, gray, laplacian, var_scale = triplet
+
+    quality, contrast_score = _quality_metrics(gray, laplacian, var_scale)
+    if quality < settings.image_quality_threshold:
+        return None, quality, False, True
+
+    if settings.enable_tamper_detection and _tamper_check(gray, laplacian):
+        return None, quality, True, True
+
+    return _preprocess_array(bgr, contrast_score), quality, False, True
+
+
 class PaddleOCRAdapter(PerceptionAdapter):
     """
     PaddleOCR implementation of PerceptionAdapter.
@@ -39,20 +291,63 @@ class PaddleOCRAdapter(PerceptionAdapter):
         """
         try:
             from paddleocr import PaddleOCR
-            self.ocr = PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
         except ImportError:
             raise ImportError(
                 "PaddleOCR not installed. Run: pip install paddleocr"
             )
 
+        # High-performance inference: optimized backend (OpenVINO/ONNXRuntime)
+        # + FP16 cuts det/rec latency substantially on CPU. Kernel selection
+        # happens once since the adapter lives in the engine singleton.
+        ocr_kwargs = {"use_angle_cls": True, "lang": "en", "show_log": False}
+        if settings.ocr_enable_hpi:
+            import os
+            ocr_kwargs.update({
+                "enable_hpi": True,
+                "use_onnx": settings.ocr_backend in ("openvino", "onnxruntime"),
+                "precision": "fp16",
+                "cpu_threads": os.cpu_count(),
+            })
+
+        try:
+            self.ocr = PaddleOCR(**ocr_kwargs)
+        except TypeError:
+            # Installed PaddleOCR predates the HPI flags - fall back to defaults
+            logger.warning("PaddleOCR build does not support HPI flags, using default backend")
+            self.ocr = PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
+
         self.confidence_threshold = confidence_threshold or settings.model_a_confidence_threshold
+        # Created lazily on the first real batch; workers only import the
+        # module-level preprocessing functions, never the Paddle model.
+        self._preprocess_pool: Optional[ProcessPoolExecutor] = None
 
         logger.info(
             "PaddleOCR adapter initialized",
             extra={"confidence_threshold": self.confidence_threshold}
         )
 
-    def extract(self, image_path: str) -> OCRResult:
+    def _load_image(self, image: ImageInput) -> Optional[np.ndarray]:
+        """
+        Decode an image input (path, raw bytes, or ndarray) to a BGR array.
+
+        In-memory inputs skip the tempfile round-trip entirely: bytes are
+        decoded with cv2.imdecode and arrays are passed through untouched.
+
+        Args:
+            image: Image path, encoded bytes, or decoded ndarray
+
+        Returns:
+            BGR image array, or None if decoding fails
+        """
+        return _decode_image(image)
+
+    def _image_ref(self, image: ImageInput) -> str:
+        """Short, PII-free reference to an image input for logging."""
+        if isinstance(image, (str, Path)):
+            return Path(image).name
+        return "<in-memory>"
+
+    def extract(self, image: ImageInput) -> OCRResult:
         """
         Extract text using PaddleOCR with preprocessing.
 
@@ -65,7 +360,7 @@ class PaddleOCRAdapter(PerceptionAdapter):
         6. Calculate confidence
 
         Args:
-            image_path: Path to driver license image
+            image: Driver license image (path, encoded bytes, or ndarray)
 
         Returns:
             OCRResult with extracted fields and confidence
@@ -77,188 +372,241 @@ class PaddleOCRAdapter(PerceptionAdapter):
             OCRFailedError: If extraction fails completely
         """
         try:
-            # 1. Validate quality
-            quality = self.validate_quality(image_path)
-            if quality < settings.image_quality_threshold:
-                raise ImageQualityError(
-                    f"Image quality too low: {quality:.2f} < {settings.image_quality_threshold}",
-                    quality_score=quality
-                )
-
-            # 2. Check tampering
-            if settings.enable_tamper_detection:
-                tamper_detected = self.detect_tampering(image_path)
-                if tamper_detected:
-                    raise TamperDetectedError(
-                        "Image tampering detected",
-                        tamper_indicators=["edge_discontinuities", "noise_anomalies"]
-                    )
-            else:
-                tamper_detected = False
-
-            # 3. Preprocess
-            preprocessed_path = self.preprocess(image_path)
+            preprocessed, quality, tamper_detected = self._prepare(image)
 
             # 4. Run OCR
-            logger.info(f"Running OCR on image", extra={"image_path": Path(image_path).name})
-            result = self.ocr.ocr(preprocessed_path, cls=True)
-
-            if not result or not result[0]:
-                raise OCRFailedError(
-                    "OCR returned no results",
-                    image_path=image_path,
-                    confidence=0.0
-                )
-
-            # 5. Parse structured fields
-            text_fields = self._parse_driver_license(result[0])
-
-            # 6. Calculate overall confidence
-            confidences = [line[1][1] for line in result[0]]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-
-            if avg_confidence < self.confidence_threshold:
-                raise LowConfidenceError(
-                    f"OCR confidence too low: {avg_confidence:.2f} < {self.confidence_threshold}",
-                    confidence=avg_confidence,
-                    threshold=self.confidence_threshold
-                )
-
-            logger.info(
-                "OCR extraction successful",
-                extra={
-                    "confidence": avg_confidence,
-                    "quality": quality,
-                    "fields_extracted": len(text_fields)
-                }
-            )
-
-            return OCRResult(
-                text_fields=text_fields,
-                confidence=avg_confidence,
-                quality_score=quality,
-                tamper_detected=tamper_detected,
-                metadata={
-                    "num_text_blocks": len(result[0]),
-                    "image_path": str(Path(image_path).name),
-                    "preprocessed": True
-                },
-                timestamp=datetime.now()
+            logger.info(f"Running OCR on image", extra={"image_path": self._image_ref(image)})
+            result = self.ocr.ocr(preprocessed, cls=True)
+
+            return self._result_from_ocr(
+                image,
+                result[0] if result else None,
+                quality,
+                tamper_detected,
             )
 
-        except (ImageQualityError, TamperDetectedError, LowConfidenceError):
+        except (ImageQualityError, TamperDetectedError, LowConfidenceError, OCRFailedError):
             # Re-raise known errors
             raise
         except Exception as e:
             logger.error(
                 "OCR extraction failed",
-                extra={"error": str(e), "image_path": Path(image_path).name},
+                extra={"error": str(e), "image_path": self._image_ref(image)},
                 exc_info=True
             )
             raise OCRFailedError(
                 f"OCR extraction failed: {str(e)}",
-                image_path=image_path,
+                image_path=self._image_ref(image),
                 confidence=0.0
             )
 
-    def validate_quality(self, image_path: str) -> float:
+    def _prepare(self, image: ImageInput) -> tuple:
         """
-        Assess image quality using blur detection and contrast analysis.
-
-        Args:
-            image_path: Path to image
+        Decode, quality-check, tamper-check, and preprocess one image.
 
         Returns:
-            Quality score (0.0-1.0)
+            (preprocessed_array, quality_score, tamper_detected)
+
+        Raises:
+            OCRFailedError, ImageQualityError, TamperDetectedError
         """
-        try:
-            image = cv2.imread(image_path)
-            if image is None:
-                return 0.0
-
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-            # 1. Blur detection (Laplacian variance)
-            laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
-            # Normalize: higher variance = sharper image
-            blur_score = min(laplacian_var / 1000.0, 1.0)  # Typical sharp images have var > 500
-
-            # 2. Contrast analysis
-            contrast = gray.std() / 128.0  # Normalize by half of grayscale range
-            contrast_score = min(contrast, 1.0)
-
-            # 3. Brightness (avoid over/under exposure)
-            brightness = gray.mean() / 255.0
-            # Ideal brightness: 0.3-0.7 range
-            if 0.3 <= brightness <= 0.7:
-                brightness_score = 1.0
-            else:
-                brightness_score = max(0.0, 1.0 - abs(brightness - 0.5) * 2)
+        return self._apply_prepare_policy(image, _prepare_arrays(image))
 
-            # Weighted average
-            quality = (
-                0.5 * blur_score +
-                0.3 * contrast_score +
-                0.2 * brightness_score
+    def _apply_prepare_policy(self, image: ImageInput, prepared: tuple) -> tuple:
+        """Turn a _prepare_arrays tuple into a result or adapter exception."""
+        preprocessed, quality, tamper_detected, decode_ok = prepared
+        if not decode_ok:
+            raise OCRFailedError(
+                "Failed to decode image",
+                image_path=self._image_ref(image),
+                confidence=0.0
+            )
+        if quality < settings.image_quality_threshold:
+            raise ImageQualityError(
+                f"Image quality too low: {quality:.2f} < {settings.image_quality_threshold}",
+                quality_score=quality
             )
+        if tamper_detected:
+            raise TamperDetectedError(
+                "Image tampering detected",
+                tamper_indicators=["edge_discontinuities", "noise_anomalies"]
+            )
+        return preprocessed, quality, tamper_detected
+
+    def _result_from_ocr(
+        self,
+        image: ImageInput,
+        ocr_lines: Optional[list],
+        quality: float,
+        tamper_detected: bool,
+    ) -> OCRResult:
+        """
+        Parse one image's OCR output into an OCRResult.
 
-            return quality
+        Raises:
+            OCRFailedError: If OCR returned nothing
+            LowConfidenceError: If confidence below threshold
+        """
+        if not ocr_lines:
+            raise OCRFailedError(
+                "OCR returned no results",
+                image_path=self._image_ref(image),
+                confidence=0.0
+            )
 
-        except Exception as e:
-            logger.warning(f"Quality validation failed: {e}")
-            return 0.0
+        # 5. Parse structured fields
+        text_fields = self._parse_driver_license(ocr_lines)
+
+        # 6. Calculate overall confidence
+        confidences = [line[1][1] for line in ocr_lines]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+
+        if avg_confidence < self.confidence_threshold:
+            raise LowConfidenceError(
+                f"OCR confidence too low: {avg_confidence:.2f} < {self.confidence_threshold}",
+                confidence=avg_confidence,
+                threshold=self.confidence_threshold
+            )
 
-    def detect_tampering(self, image_path: str) -> bool:
+        logger.info(
+            "OCR extraction successful",
+            extra={
+                "confidence": avg_confidence,
+                "quality": quality,
+                "fields_extracted": len(text_fields)
+            }
+        )
+
+        return OCRResult(
+            text_fields=text_fields,
+            confidence=avg_confidence,
+            quality_score=quality,
+            tamper_detected=tamper_detected,
+            metadata={
+                "num_text_blocks": len(ocr_lines),
+                "image_path": self._image_ref(image),
+                "preprocessed": True
+            },
+            timestamp=datetime.now()
+        )
+
+    def _prep_pool(self) -> ProcessPoolExecutor:
+        """Lazily created process pool for CPU-side batch preprocessing."""
+        if self._preprocess_pool is None:
+            # spawn, not fork: the pool is created on first request, after
+            # uvicorn and PaddleOCR have started threads, and forking a
+            # multithreaded process can deadlock the children
+            self._preprocess_pool = ProcessPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) // 2),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._preprocess_pool
+
+    def extract_batch(self, images: list) -> list:
         """
-        Detect image tampering using edge analysis and noise detection.
+        Extract text from multiple images in one batched pass.
 
-        Basic tampering detection - production would use more sophisticated methods.
+        Used by the dynamic batcher to amortize PaddleOCR overhead across
+        concurrent requests. All surviving preprocessed arrays are handed to
+        a single ocr() call, which batches detection + recognition inside
+        Paddle instead of paying per-image model-call overhead. Per-image
+        failures are returned in-place as exception instances so one bad
+        image doesn't fail the batch.
 
         Args:
-            image_path: Path to image
+            images: List of driver license images (paths, bytes, or ndarrays)
 
         Returns:
-            True if tampering detected
+            List of OCRResult (or exception) per input, in input order
         """
+        results: list = [None] * len(images)
+
+        # CPU preprocessing is embarrassingly parallel across images; fan it
+        # out to a process pool for real batches. Small batches stay serial
+        # to avoid pool submission overhead.
+        if len(images) >= 4:
+            prepared = list(self._prep_pool().map(_prepare_arrays, images, chunksize=4))
+        else:
+            prepared = [_prepare_arrays(image) for image in images]
+
+        pending = []  # (input_index, preprocessed, quality, tamper_detected)
+        for i, (image, prep) in enumerate(zip(images, prepared)):
+            try:
+                preprocessed, quality, tamper = self._apply_prepare_policy(image, prep)
+                pending.append((i, preprocessed, quality, tamper))
+            except Exception as e:
+                results[i] = e
+
+        if not pending:
+            return results
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running batched OCR on %d images", len(pending))
         try:
-            image = cv2.imread(image_path)
-            if image is None:
-                return False
+            batch_output = self.ocr.ocr([p[1] for p in pending], cls=True)
+        except Exception as e:
+            for i, *_ in pending:
+                results[i] = OCRFailedError(
+                    f"Batched OCR failed: {e}",
+                    image_path=self._image_ref(images[i]),
+                    confidence=0.0
+                )
+            return results
 
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        for (i, _, quality, tamper), ocr_lines in zip(pending, batch_output):
+            try:
+                results[i] = self._result_from_ocr(images[i], ocr_lines, quality, tamper)
+            except Exception as e:
+                results[i] = e
+        return results
 
-            # 1. Edge discontinuities (tampered images often have irregular edges)
-            edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.sum(edges > 0) / edges.size
+    def validate_quality(self, image: ImageInput) -> float:
+        """
+        Assess image quality using blur detection and contrast analysis.
 
-            # Typical driver licenses have consistent edge density (0.05-0.15)
-            if edge_density < 0.02 or edge_density > 0.25:
-                logger.warning(f"Suspicious edge density: {edge_density:.3f}")
-                return True
+        Thin shim over _quality_from_gray; extract() calls the gray-array
+        variant directly so the image is decoded and converted only once.
 
-            # 2. Noise analysis (JPEG compression artifacts)
-            # Compute noise level using high-frequency component
-            fft = np.fft.fft2(gray)
-            fft_shift = np.fft.fftshift(fft)
-            magnitude = np.abs(fft_shift)
+        Args:
+            image: Image (path, encoded bytes, or ndarray)
 
-            # High noise in specific frequency bands indicates tampering
-            high_freq_noise = np.mean(magnitude[magnitude.shape[0]//4:3*magnitude.shape[0]//4,
-                                               magnitude.shape[1]//4:3*magnitude.shape[1]//4])
+        Returns:
+            Quality score (0.0-1.0)
+        """
+        image = self._load_image(image)
+        if image is None:
+            return 0.0
+        return self._quality_from_gray(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
+
+    def _quality_from_gray(self, gray: np.ndarray, laplacian: Optional[np.ndarray] = None) -> float:
+        """Quality score (0.0-1.0) from a precomputed grayscale array."""
+        return _quality_score(gray, laplacian)
+
+    def detect_tampering(self, image: ImageInput) -> bool:
+        """
+        Detect image tampering using edge analysis and noise detection.
+
+        Basic tampering detection - production would use more sophisticated
+        methods. Thin shim over _tamper_from_gray; extract() calls the
+        gray-array variant directly so the image is decoded and converted
+        only once.
 
-            # Threshold increased to 50000 to avoid false positives on compressed images
-            if high_freq_noise > 50000:  # Threshold tuned for synthetic/compressed images
-                logger.warning(f"Suspicious high-frequency noise: {high_freq_noise:.1f}")
-                return True
+        Args:
+            image: Image (path, encoded bytes, or ndarray)
 
+        Returns:
+            True if tampering detected
+        """
+        image = self._load_image(image)
+        if image is None:
             return False
+        return self._tamper_from_gray(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY))
 
-        except Exception as e:
-            logger.warning(f"Tamper detection failed: {e}")
-            return False  # Fail open (don't reject image on detection failure)
+    def _tamper_from_gray(self, gray: np.ndarray, laplacian: Optional[np.ndarray] = None) -> bool:
+        """Tamper heuristics on a precomputed grayscale array."""
+        return _tamper_check(gray, laplacian)
 
-    def preprocess(self, image_path: str) -> str:
+    def preprocess(self, image: ImageInput) -> np.ndarray:
         """
         Preprocess image to enhance OCR accuracy.
 
@@ -269,46 +617,16 @@ class PaddleOCRAdapter(PerceptionAdapter):
         - Rotation correction
 
         Args:
-            image_path: Path to original image
+            image: Original image (path, encoded bytes, or ndarray)
 
         Returns:
-            Path to preprocessed image
+            Preprocessed image array (ready for OCR, no disk round-trip)
         """
-        try:
-            image = cv2.imread(image_path)
-            if image is None:
-                return image_path  # Return original if preprocessing fails
-
-            # 1. Denoise
-            denoised = cv2.fastNlMeansDenoisingColored(image, None, 10, 10, 7, 21)
-
-            # 2. Convert to grayscale for processing
-            gray = cv2.cvtColor(denoised, cv2.COLOR_BGR2GRAY)
-
-            # 3. Contrast enhancement (CLAHE - Contrast Limited Adaptive Histogram Equalization)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            enhanced = clahe.apply(gray)
-
-            # 4. Rotation correction (basic - check if text is rotated)
-            # This is simplified - production would use more sophisticated deskewing
-
-            # 5. Resize to standard dimensions (if too small)
-            height, width = enhanced.shape
-            if width < 800 or height < 600:
-                scale = max(800 / width, 600 / height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                enhanced = cv2.resize(enhanced, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
-
-            # Save preprocessed image
-            preprocessed_path = str(Path(image_path).with_suffix('.preprocessed.png'))
-            cv2.imwrite(preprocessed_path, enhanced)
-
-            return preprocessed_path
-
-        except Exception as e:
-            logger.warning(f"Preprocessing failed: {e}, using original image")
-            return image_path
+        original = self._load_image(image)
+        if original is None:
+            logger.warning("Failed to decode image for preprocessing, passing through")
+            return image
+        return _preprocess_array(original)
 
     def _parse_driver_license(self, ocr_result: list) -> Dict[str, str]:
         """
@@ -327,44 +645,44 @@ class PaddleOCRAdapter(PerceptionAdapter):
         full_text = " ".join(text_blocks)
 
         # 1. Extract name (heuristic: look for "NAME" keyword or typical name patterns)
-        name_match = re.search(r'(?:NAME|LN)\s*[:;]?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', full_text, re.IGNORECASE)
+        name_match = _NAME_RE.search(full_text)
         if name_match:
             fields["name"] = name_match.group(1).strip()
         else:
             # Fallback: first capitalized multi-word phrase
-            name_fallback = re.search(r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)', full_text)
+            name_fallback = _NAME_FALLBACK_RE.search(full_text)
             if name_fallback:
                 fields["name"] = name_fallback.group(1).strip()
 
         # 2. Extract DOB (common formats: MM/DD/YYYY, YYYY-MM-DD)
-        dob_match = re.search(r'(?:DOB|DATE OF BIRTH)\s*[:;]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{4}-\d{2}-\d{2})', full_text, re.IGNORECASE)
+        dob_match = _DOB_RE.search(full_text)
         if dob_match:
             dob = dob_match.group(1).strip()
             # Normalize to YYYY-MM-DD
             fields["dob"] = self._normalize_date(dob)
         else:
             # Fallback: any date pattern
-            dob_fallback = re.search(r'(\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{4}-\d{2}-\d{2})', full_text)
+            dob_fallback = _DOB_FALLBACK_RE.search(full_text)
             if dob_fallback:
                 fields["dob"] = self._normalize_date(dob_fallback.group(1).strip())
 
         # 3. Extract state (2-letter abbreviation)
-        state_match = re.search(r'\b([A-Z]{2})\b', full_text)
+        state_match = _STATE_RE.search(full_text)
         if state_match:
             fields["state"] = state_match.group(1)
 
         # 4. Extract license number (alphanumeric, typically 8-12 characters)
-        license_match = re.search(r'(?:DL|LIC|LICENSE)\s*#?\s*[:;]?\s*([A-Z0-9]{6,15})', full_text, re.IGNORECASE)
+        license_match = _LICENSE_RE.search(full_text)
         if license_match:
             fields["license_number"] = license_match.group(1).strip()
         else:
             # Fallback: any alphanumeric sequence 8-12 chars
-            license_fallback = re.search(r'\b([A-Z0-9]{8,12})\b', full_text)
+            license_fallback = _LICENSE_FALLBACK_RE.search(full_text)
             if license_fallback:
                 fields["license_number"] = license_fallback.group(1).strip()
 
         # 5. Extract address (this is challenging - use multi-line heuristic)
-        address_match = re.search(r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way)[,\s]+[A-Za-z\s]+,?\s*[A-Z]{2}\s+\d{5})', full_text, re.IGNORECASE)
+        address_match = _ADDRESS_RE.search(full_text)
         if address_match:
             fields["address"] = address_match.group(1).strip()
 
@@ -374,29 +692,34 @@ class PaddleOCRAdapter(PerceptionAdapter):
         """
         Normalize date to YYYY-MM-DD format.
 
+        Hand-rolled instead of a strptime format ladder: each failed
+        strptime attempt costs an exception, and OCR dates miss the first
+        format often enough that the old loop threw several per record.
+        Two anchored patterns plus range checks cover the same shapes.
+
         Args:
             date_str: Date in various formats (MM/DD/YYYY, M/D/YYYY, YYYY-MM-DD)
 
         Returns:
             Date in YYYY-MM-DD format
         """
-        from datetime import datetime
-
-        # Try common formats
-        formats = [
-            "%m/%d/%Y",
-            "%m-%d-%Y",
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%d/%m/%Y",  # European format
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
+        m = _ISO_DATE_RE.match(date_str)
+        if m:
+            year, month, day = m.group(1), int(m.group(2)), int(m.group(3))
+            if 1 <= month <= 12 and 1 <= day <= 31:
+                return f"{year}-{month:02d}-{day:02d}"
+            return date_str
+
+        m = _DMY_OR_MDY_RE.match(date_str)
+        if m:
+            first, second, year = int(m.group(1)), int(m.group(2)), m.group(3)
+            if first > 12:
+                # First field can't be a month: European day-first
+                month, day = second, first
+            else:
+                month, day = first, second
+            if 1 <= month <= 12 and 1 <= day <= 31:
+                return f"{year}-{month:02d}-{day:02d}"
 
-        # If all formats fail, return original
+        # Unrecognized shape, return original
         return date_str
@@ -15,10 +15,15 @@ from adapter.config.settings import settings
 from adapter.config.logging_config import logger
 from adapter.prompts.risk_assessment_prompts import (
     generate_risk_assessment_prompt,
+    generate_batch_risk_assessment_prompt,
     generate_text_interpretation_prompt,
     ROLE_RISK_EXPERT,
 )
 
+# Records packed per batched risk-assessment call; keeps the combined
+# prompt + array response comfortably inside the context window
+RISK_BATCH_SIZE = 10
+
 
 class GPT4oMiniAdapter(ReasoningAdapter):
     """
@@ -35,8 +40,11 @@ class GPT4oMiniAdapter(ReasoningAdapter):
             api_key: OpenAI API key (uses settings if None)
         """
         try:
-            from openai import OpenAI
+            from openai import OpenAI, AsyncOpenAI
             self.client = OpenAI(api_key=api_key or settings.openai_api_key)
+            # Native async client for the event-loop path - no worker-thread
+            # hop per LLM call
+            self.async_client = AsyncOpenAI(api_key=api_key or settings.openai_api_key)
         except ImportError:
             raise ImportError("OpenAI SDK not installed. Run: pip install openai")
 
@@ -75,7 +83,95 @@ class GPT4oMiniAdapter(ReasoningAdapter):
 
             logger.info("Calling OpenAI API for risk assessment")
 
-            response = self.client.chat.completions.create(
+            response_text, tokens_used = self._stream_completion(
+                [{"role": "user", "content": prompt}]
+            )
+
+            return self._assessment_from_text(response_text, tokens_used)
+
+        except TimeoutError as e:
+            raise APITimeoutError(
+                f"OpenAI API timeout after {settings.api_request_timeout}s",
+                api_name="OpenAI",
+                timeout_seconds=settings.api_request_timeout
+            )
+        except Exception as e:
+            logger.error(f"Risk assessment failed: {e}", exc_info=True)
+            raise RiskAssessmentError(f"Risk assessment failed: {str(e)}")
+
+    def _stream_completion(self, messages: list) -> tuple:
+        """
+        Stream a completion, stopping as soon as a balanced JSON object
+        has arrived.
+
+        Brace-depth tracking on the accumulated deltas lets the adapter
+        close the stream before a runaway completion finishes, saving both
+        latency and output tokens. Braces inside string values can fool
+        the counter, in which case the full completion is consumed and the
+        downstream regex extraction still applies.
+
+        Returns:
+            (accumulated_text, total_tokens or None if the stream was cut)
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            timeout=settings.api_request_timeout,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        parts = []
+        depth = 0
+        opened = False
+        tokens_used = None
+        try:
+            for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    tokens_used = chunk.usage.total_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                parts.append(delta)
+                for ch in delta:
+                    if ch == "{":
+                        depth += 1
+                        opened = True
+                    elif ch == "}":
+                        depth -= 1
+                if opened and depth == 0:
+                    break
+        finally:
+            stream.close()
+
+        return "".join(parts), tokens_used
+
+    async def assess_risk_async(self, applicant_data: Dict[str, Any]) -> RiskAssessment:
+        """
+        Async risk assessment via the native AsyncOpenAI client.
+
+        Same pipeline and error mapping as assess_risk, but awaits the API
+        call directly on the event loop instead of delegating to a worker
+        thread.
+
+        Args:
+            applicant_data: Extracted data from Model A
+
+        Returns:
+            RiskAssessment with score, factors, and confidence
+
+        Raises:
+            RiskAssessmentError: If risk calculation fails
+            APITimeoutError: If OpenAI API times out
+        """
+        try:
+            prompt = generate_risk_assessment_prompt(applicant_data)
+
+            logger.info("Calling OpenAI API for risk assessment")
+
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -88,40 +184,143 @@ class GPT4oMiniAdapter(ReasoningAdapter):
                 timeout=settings.api_request_timeout
             )
 
-            # Parse JSON response
-            response_text = response.choices[0].message.content
-            risk_data = self._parse_risk_response(response_text)
-
-            logger.info(
-                "Risk assessment complete",
-                extra={
-                    "risk_score": risk_data["risk_score"],
-                    "num_factors": len(risk_data["risk_factors"]),
-                    "requires_review": risk_data["requires_manual_review"]
-                }
+            return self._build_assessment(response)
+
+        except TimeoutError as e:
+            raise APITimeoutError(
+                f"OpenAI API timeout after {settings.api_request_timeout}s",
+                api_name="OpenAI",
+                timeout_seconds=settings.api_request_timeout
             )
+        except Exception as e:
+            logger.error(f"Risk assessment failed: {e}", exc_info=True)
+            raise RiskAssessmentError(f"Risk assessment failed: {str(e)}")
+
+    def assess_risk_batch(self, records: List[Dict[str, Any]]) -> List[RiskAssessment]:
+        """
+        Assess several applicants with one API call per RISK_BATCH_SIZE chunk.
+
+        A single prompt carrying a JSON array of records amortizes the
+        role/instruction tokens and the network round trip across the
+        batch. Items the model fails to return (or returns malformed) get
+        the standard conservative fallback assessment.
+
+        Args:
+            records: List of applicant_data dicts
+
+        Returns:
+            List of RiskAssessment, same order as records
 
-            return RiskAssessment(
+        Raises:
+            RiskAssessmentError: If a batch API call fails
+            APITimeoutError: If OpenAI API times out
+        """
+        assessments: List[RiskAssessment] = []
+        for start in range(0, len(records), RISK_BATCH_SIZE):
+            chunk = records[start:start + RISK_BATCH_SIZE]
+            try:
+                prompt = generate_batch_risk_assessment_prompt(chunk)
+
+                logger.info("Calling OpenAI API for batched risk assessment (%d records)", len(chunk))
+
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens * len(chunk),
+                    timeout=settings.api_request_timeout
+                )
+            except TimeoutError:
+                raise APITimeoutError(
+                    f"OpenAI API timeout after {settings.api_request_timeout}s",
+                    api_name="OpenAI",
+                    timeout_seconds=settings.api_request_timeout
+                )
+            except Exception as e:
+                logger.error(f"Batched risk assessment failed: {e}", exc_info=True)
+                raise RiskAssessmentError(f"Batched risk assessment failed: {str(e)}")
+
+            assessments.extend(self._build_batch_assessments(response, len(chunk)))
+        return assessments
+
+    def _build_batch_assessments(self, response, expected: int) -> List[RiskAssessment]:
+        """Parse a JSON-array chat response into one RiskAssessment per record."""
+        response_text = response.choices[0].message.content
+        try:
+            items = json.loads(self._extract_json_array(response_text))
+            if not isinstance(items, list):
+                raise ValueError("Batch response is not a JSON array")
+        except Exception as e:
+            logger.error(f"Failed to parse batch risk response: {e}")
+            items = []
+
+        fallback = {
+            "risk_score": 0.8,
+            "risk_factors": ["Unable to assess risk - parsing error"],
+            "confidence": 0.3,
+            "requires_manual_review": True
+        }
+        # Validate each positional item through the single-record parser;
+        # missing or malformed entries fall back conservatively.
+        assessments = []
+        for i in range(expected):
+            if i < len(items) and isinstance(items[i], dict):
+                risk_data = self._parse_risk_response(json.dumps(items[i]))
+            else:
+                risk_data = dict(fallback)
+            assessments.append(RiskAssessment(
                 risk_score=risk_data["risk_score"],
                 risk_factors=risk_data["risk_factors"],
                 confidence=risk_data["confidence"],
                 requires_manual_review=risk_data["requires_manual_review"],
                 metadata={
                     "model": self.model,
-                    "tokens_used": response.usage.total_tokens
+                    "tokens_used": response.usage.total_tokens,
+                    "batch_size": expected
                 },
                 timestamp=datetime.now()
-            )
+            ))
+        return assessments
 
-        except TimeoutError as e:
-            raise APITimeoutError(
-                f"OpenAI API timeout after {settings.api_request_timeout}s",
-                api_name="OpenAI",
-                timeout_seconds=settings.api_request_timeout
-            )
-        except Exception as e:
-            logger.error(f"Risk assessment failed: {e}", exc_info=True)
-            raise RiskAssessmentError(f"Risk assessment failed: {str(e)}")
+    def _extract_json_array(self, text: str) -> str:
+        """Extract a JSON array from text (handles markdown code blocks)."""
+        span = self._find_json_span(text, "[", "]")
+        if span:
+            return text[span[0]:span[1]]
+
+        return text.strip()
+
+    def _build_assessment(self, response) -> RiskAssessment:
+        """Parse an OpenAI chat response into a RiskAssessment."""
+        return self._assessment_from_text(
+            response.choices[0].message.content,
+            response.usage.total_tokens,
+        )
+
+    def _assessment_from_text(self, response_text: str, tokens_used) -> RiskAssessment:
+        """Parse completion text (streamed or not) into a RiskAssessment."""
+        risk_data = self._parse_risk_response(response_text)
+
+        logger.info(
+            "Risk assessment complete",
+            extra={
+                "risk_score": risk_data["risk_score"],
+                "num_factors": len(risk_data["risk_factors"]),
+                "requires_review": risk_data["requires_manual_review"]
+            }
+        )
+
+        return RiskAssessment(
+            risk_score=risk_data["risk_score"],
+            risk_factors=risk_data["risk_factors"],
+            confidence=risk_data["confidence"],
+            requires_manual_review=risk_data["requires_manual_review"],
+            metadata={
+                "model": self.model,
+                "tokens_used": tokens_used
+            },
+            timestamp=datetime.now()
+        )
 
     def interpret_text(self, text: str, context: str) -> Dict[str, Any]:
         """
@@ -200,6 +399,44 @@ class GPT4oMiniAdapter(ReasoningAdapter):
                 "requires_manual_review": True
             }
 
+    @staticmethod
+    def _find_json_span(text: str, open_ch: str = "{", close_ch: str = "}"):
+        """
+        Locate the first balanced JSON object/array with a linear scan.
+
+        Walks the text once, tracking string literals (and escapes) so
+        braces inside values don't confuse the depth count. Linear in the
+        input, unlike a greedy DOTALL regex which backtracks quadratically
+        on long LLM outputs.
+
+        Returns:
+            (start, end) span including the delimiters, or None
+        """
+        depth = 0
+        start = None
+        in_string = False
+        escaped = False
+        for i, ch in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+                continue
+            if ch == '"':
+                in_string = True
+            elif ch == open_ch:
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif ch == close_ch and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    return start, i + 1
+        return None
+
     def _extract_json(self, text: str) -> str:
         """
         Extract JSON from text (handles markdown code blocks).
@@ -210,17 +447,11 @@ class GPT4oMiniAdapter(ReasoningAdapter):
         Returns:
             Extracted JSON string
         """
-        import re
-
-        # Try to find JSON in markdown code block
-        json_match = re.search(r'```json\s*(\{.*?\})\s*```', text, re.DOTALL)
-        if json_match:
-            return json_match.group(1)
-
-        # Try to find raw JSON object
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            return json_match.group(0)
+        # First balanced object wins; this also handles markdown-fenced
+        # responses since the fence characters sit outside the braces
+        span = self._find_json_span(text)
+        if span:
+            return text[span[0]:span[1]]
 
         # If no JSON found, assume entire text is JSON
         return text.strip()
@@ -4,8 +4,11 @@ RapidFuzz-based Fuzzy Matcher for Probabilistic Linkage.
 Implements FuzzyMatcher interface for name matching across datasets.
 """
 
+import logging
 from typing import List, Tuple
-from rapidfuzz import fuzz, process
+
+import numpy as np
+from rapidfuzz import fuzz, process, utils
 
 from adapter.core.interfaces.reasoning_interface import FuzzyMatcher
 from adapter.exceptions.parser_exceptions import FuzzyMatchAmbiguousError
@@ -30,8 +33,34 @@ class RapidFuzzMatcher(FuzzyMatcher):
             ambiguity_threshold: Max number of high-confidence matches before flagging ambiguity
         """
         self.ambiguity_threshold = ambiguity_threshold
+        # Normalized candidate lists keyed by list identity; the NICS name
+        # list is static across queries, so it is processed once rather
+        # than once per fuzzy_match call. Entries hold the candidate list
+        # object itself: a bare id() key would be fooled by CPython reusing
+        # a freed list's id, and keeping the reference pins the id.
+        self._processed_cache: dict = {}
         logger.info(f"RapidFuzz matcher initialized with ambiguity_threshold={ambiguity_threshold}")
 
+    def _processed_candidates(self, candidates: List[str]) -> np.ndarray:
+        """
+        Return default_process-normalized candidates, cached per list.
+
+        Stored as a contiguous numpy object array rather than a Python
+        list: cdist iterates the flat pointer buffer directly, which keeps
+        per-call overhead and pointer-chasing down on NICS-sized pools.
+        """
+        key = id(candidates)
+        entry = self._processed_cache.get(key)
+        if entry is not None and entry[0] is candidates:
+            return entry[1]
+        if len(self._processed_cache) > 8:
+            self._processed_cache.clear()
+        processed = np.array(
+            [utils.default_process(c) for c in candidates], dtype=object
+        )
+        self._processed_cache[key] = (candidates, processed)
+        return processed
+
     def fuzzy_match(
         self,
         query: str,
@@ -57,12 +86,24 @@ class RapidFuzzMatcher(FuzzyMatcher):
         if not query or not candidates:
             return []
 
-        # Use token_set_ratio for robust name matching
-        matches = []
-        for candidate in candidates:
-            score = fuzz.token_set_ratio(query.lower(), candidate.lower()) / 100.0
-            if score >= threshold:
-                matches.append((candidate, score))
+        # Use token_set_ratio for robust name matching. process.cdist scores
+        # the whole candidate list in RapidFuzz's C layer (threaded via
+        # workers=-1), replacing a per-candidate Python loop. score_cutoff
+        # lets the kernel bail early on candidates that can't reach the
+        # threshold; they come back as 0.0 and fall out of the filter below.
+        scores = process.cdist(
+            [utils.default_process(query)],
+            self._processed_candidates(candidates),
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=threshold * 100.0,
+            workers=-1,
+        ).ravel() / 100.0
+
+        matches = [
+            (candidate, float(score))
+            for candidate, score in zip(candidates, scores)
+            if score >= threshold
+        ]
 
         # Sort by confidence descending
         matches.sort(key=lambda x: x[1], reverse=True)
@@ -80,22 +121,57 @@ class RapidFuzzMatcher(FuzzyMatcher):
                 confidences=[m[1] for m in high_confidence_matches]
             )
 
-        logger.info(
-            f"Fuzzy match found {len(matches)} results",
-            extra={"query": query, "num_results": len(matches), "threshold": threshold}
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Fuzzy match found %d results", len(matches),
+                extra={"query": query, "num_results": len(matches), "threshold": threshold}
+            )
 
         return matches
 
-    def match_score(self, str1: str, str2: str) -> float:
+    def match_scores(self, str1: str, str2: str) -> Tuple[float, float, float]:
+        """
+        Calculate all three match scores in one normalization pass.
+
+        Blended-matching callers want token_set, partial, and plain ratio
+        together; normalizing each string once and handing the processed
+        forms to the three C kernels avoids re-running default_process
+        (case fold + punctuation strip) per scorer.
+
+        Args:
+            str1: First string
+            str2: Second string
+
+        Returns:
+            (token_set, partial, ratio) confidences, each 0.0-1.0
+        """
+        if not str1 or not str2:
+            return 0.0, 0.0, 0.0
+
+        p1 = utils.default_process(str1)
+        p2 = utils.default_process(str2)
+        return (
+            fuzz.token_set_ratio(p1, p2) / 100.0,
+            fuzz.partial_ratio(p1, p2) / 100.0,
+            fuzz.ratio(p1, p2) / 100.0,
+        )
+
+    def match_score(self, str1: str, str2: str, scorer=None) -> float:
         """
         Calculate match score between two strings.
 
-        Uses token_set_ratio for consistency with fuzzy_match.
+        Uses token_set_ratio for consistency with fuzzy_match unless the
+        caller passes a cheaper field-appropriate scorer (token_set_ratio
+        tokenizes, builds set intersections/differences, and scores several
+        variants - overkill for fields whose tokens never reorder).
 
         Args:
             str1: First string
             str2: Second string
+            scorer: Optional rapidfuzz fuzz-style scorer (0-100 scale) to
+                use instead of token_set_ratio, e.g. fuzz.token_sort_ratio
+                for order-preserving fields or fuzz.ratio, which is the
+                plain Indel similarity with no tokenization at all
 
         Returns:
             Match confidence (0.0-1.0)
@@ -103,8 +179,9 @@ class RapidFuzzMatcher(FuzzyMatcher):
         if not str1 or not str2:
             return 0.0
 
-        score = fuzz.token_set_ratio(str1.lower(), str2.lower()) / 100.0
-        return score
+        if scorer is None:
+            scorer = fuzz.token_set_ratio
+        return scorer(str1, str2, processor=utils.default_process) / 100.0
 
     def match_score_partial(self, str1: str, str2: str) -> float:
         """
@@ -120,7 +197,7 @@ class RapidFuzzMatcher(FuzzyMatcher):
         if not str1 or not str2:
             return 0.0
 
-        score = fuzz.partial_ratio(str1.lower(), str2.lower()) / 100.0
+        score = fuzz.partial_ratio(str1, str2, processor=utils.default_process) / 100.0
         return score
 
     def match_score_levenshtein(self, str1: str, str2: str) -> float:
@@ -137,5 +214,5 @@ class RapidFuzzMatcher(FuzzyMatcher):
         if not str1 or not str2:
             return 0.0
 
-        score = fuzz.ratio(str1.lower(), str2.lower()) / 100.0
+        score = fuzz.ratio(str1, str2, processor=utils.default_process) / 100.0
         return score
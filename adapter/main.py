@@ -4,15 +4,76 @@ Gun Registry Adapter - FastAPI Application.
 Main entry point for the REST API server.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from adapter.api import routes
 from adapter.api.routes import router
-from adapter.config.settings import settings
+from adapter.config.settings import settings, HOT
 from adapter.config.logging_config import logger
 
 
+# ============================================================================
+# Lifespan (startup / shutdown)
+# ============================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize shared resources before traffic, tear them down after."""
+    logger.info("=" * 80)
+    logger.info("Gun Registry Adapter Starting")
+    logger.info("=" * 80)
+
+    # Widen the default anyio thread limiter so blocking OCR work dispatched
+    # via worker threads doesn't starve the event loop under concurrent load
+    from anyio import CapacityLimiter
+    from anyio.lowlevel import RunVar
+    RunVar("_default_thread_limiter").set(CapacityLimiter(settings.ocr_thread_pool_size))
+
+    # Eagerly build the engine so PaddleOCR model loading (seconds) happens
+    # before traffic is accepted instead of inside the first user's request
+    engine = routes.get_engine()
+    logger.info("Eligibility engine preloaded")
+
+    # Fire one synthetic OCR pass so kernel selection / program caching is
+    # already done when the first real request arrives. Only Model A is
+    # warmed - no point spending an OpenAI call on a blank image. A missing
+    # sample image must never block startup.
+    try:
+        import asyncio
+        from pathlib import Path
+
+        samples = sorted(Path(settings.synthetic_cards_path).glob("*.png"))
+        if samples:
+            await asyncio.to_thread(engine.perception.extract, str(samples[0]))
+            logger.info("OCR warm-up inference complete")
+        else:
+            logger.warning("No sample image found for OCR warm-up, skipping")
+    except Exception as e:
+        logger.warning(f"OCR warm-up failed (non-fatal): {e}")
+
+    logger.info(
+        "Configuration loaded",
+        extra={
+            "model_a_enabled": settings.enable_model_a,
+            "model_b_enabled": settings.enable_model_b,
+            "model_c_enabled": settings.enable_model_c,
+            "self_healing_enabled": settings.self_healing_enabled,
+            "use_synthetic_nics": settings.use_synthetic_nics
+        }
+    )
+    logger.info(f"API server listening on {settings.api_host}:{settings.api_port}")
+    logger.info("=" * 80)
+
+    yield
+
+    logger.info("Gun Registry Adapter Shutting Down")
+
+
 # ============================================================================
 # FastAPI Application
 # ============================================================================
@@ -23,22 +84,54 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # ============================================================================
 # CORS Middleware
 # ============================================================================
 
-# Parse CORS origins from settings
+# Parse CORS origins once at import. Entries containing "*" would be
+# matched literally by Starlette's per-request list scan, so wildcard
+# entries compile into a single allow_origin_regex (one anchored match per
+# request) and only exact origins stay in the list.
+import re as _re
+
 cors_origins = [origin.strip() for origin in settings.api_cors_origins.split(",")]
+_exact_origins = [o for o in cors_origins if "*" not in o]
+_wildcards = [_re.escape(o).replace(r"\*", ".*") for o in cors_origins if "*" in o and o != "*"]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# allow_credentials with a bare "*" origin is invalid per spec and forces
+# a per-request branch in Starlette, so credentials are dropped there
+_allow_all = "*" in cors_origins
+_allow_credentials = not _allow_all
+
+# max_age lets browsers cache the preflight verdict for a day, dropping
+# one OPTIONS round trip per cross-origin POST; the method/header lists
+# cover exactly what the API serves, keeping the preflight response small.
+_cors_kwargs = {
+    "allow_origins": ["*"] if _allow_all else _exact_origins,
+    "allow_credentials": _allow_credentials,
+    "allow_methods": ["GET", "POST", "OPTIONS"],
+    "allow_headers": ["Content-Type", "Authorization"],
+    "max_age": 86400,
+}
+if _wildcards:
+    _cors_kwargs["allow_origin_regex"] = "|".join(_wildcards)
+
+app.add_middleware(CORSMiddleware, **_cors_kwargs)
+
+# ============================================================================
+# Response Compression
+# ============================================================================
+
+# JSON payloads here compress several-fold; zlib at level 5 is cheap next
+# to the wire savings. minimum_size keeps tiny bodies (health probes)
+# uncompressed, where the header overhead would outweigh the gain. Brotli
+# is available via brotli-asgi's BrotliMiddleware (gzip_fallback=True) for
+# deployments that want it; gzip covers every client here.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # ============================================================================
 # Include Routers
@@ -47,80 +140,99 @@ app.add_middleware(
 app.include_router(router)
 
 # ============================================================================
-# Root Endpoint
+# Request Size Guard
 # ============================================================================
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
-        "name": "Gun Registry Adapter",
-        "version": "1.0.0",
-        "description": "AI-powered firearm eligibility assessment system",
-        "models": {
-            "model_a": "PaddleOCR (Perception/OCR)",
-            "model_b": "OpenAI GPT-4o mini (Reasoning/Risk Assessment)",
-            "model_c": "Anthropic Claude (Self-Healing)"
-        },
-        "endpoints": {
-            "eligibility": "/api/v1/eligibility",
-            "registry_submit": "/api/v1/registry/submit",
-            "health": "/api/v1/health",
-            "docs": "/docs"
-        }
-    }
+# Largest body any endpoint legitimately accepts: a full batch of images at
+# the upload cap, inflated by base64's 4/3 overhead, plus slack for the JSON
+# envelope. Checked against Content-Length before the body is read, let
+# alone parsed. Per-image caps are still enforced inside the endpoints.
+_max_body_bytes = (
+    (HOT.max_upload_bytes * 4) // 3 * settings.api_max_batch_size + 16384
+)
+
+
+@app.middleware("http")
+async def enforce_content_length(request, call_next):
+    """Reject oversized requests before buffering or parsing the body."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > _max_body_bytes:
+        return ORJSONResponse(
+            status_code=413,
+            content={
+                "error": "PAYLOAD_TOO_LARGE",
+                "message": f"Request body exceeds {settings.max_file_upload_size_mb} MB limit"
+            }
+        )
+    return await call_next(request)
 
 # ============================================================================
-# Startup/Shutdown Events
+# Root Endpoint
 # ============================================================================
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info("=" * 80)
-    logger.info("Gun Registry Adapter Starting")
-    logger.info("=" * 80)
-    logger.info(
-        "Configuration loaded",
-        extra={
-            "model_a_enabled": settings.enable_model_a,
-            "model_b_enabled": settings.enable_model_b,
-            "model_c_enabled": settings.enable_model_c,
-            "self_healing_enabled": settings.self_healing_enabled,
-            "use_synthetic_nics": settings.use_synthetic_nics
-        }
-    )
-    logger.info(f"API server listening on {settings.api_host}:{settings.api_port}")
-    logger.info("=" * 80)
-
+# The payload never changes per process, so it is serialized exactly once
+# at import; the handler returns the same bytes with no dict construction,
+# response-model validation, or JSON encoding per hit.
+_ROOT_BODY = ORJSONResponse({
+    "name": "Gun Registry Adapter",
+    "version": "1.0.0",
+    "description": "AI-powered firearm eligibility assessment system",
+    "models": {
+        "model_a": "PaddleOCR (Perception/OCR)",
+        "model_b": "OpenAI GPT-4o mini (Reasoning/Risk Assessment)",
+        "model_c": "Anthropic Claude (Self-Healing)"
+    },
+    "endpoints": {
+        "eligibility": "/api/v1/eligibility",
+        "registry_submit": "/api/v1/registry/submit",
+        "health": "/api/v1/health",
+        "docs": "/docs"
+    }
+}).body
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info("Gun Registry Adapter Shutting Down")
 
+@app.get("/", response_model=None)
+async def root():
+    """Root endpoint (static, pre-serialized)."""
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
 
 # ============================================================================
-# Global Exception Handler
+# Global Exception Handling (middleware)
 # ============================================================================
 
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    """Handle all uncaught exceptions."""
-    logger.error(
-        f"Uncaught exception: {exc}",
-        extra={"path": request.url.path},
-        exc_info=True
-    )
+@app.middleware("http")
+async def catch_unhandled(request, call_next):
+    """
+    Catch uncaught exceptions one frame above the router.
 
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "INTERNAL_SERVER_ERROR",
-            "message": "An unexpected error occurred",
-            "details": str(exc) if settings.debug else None
-        }
-    )
+    Middleware-level handling skips FastAPI's exception-matching dispatch,
+    and reading the path straight from the ASGI scope avoids building a
+    Starlette URL object on the error path.
+    """
+    try:
+        return await call_next(request)
+    except Exception as exc:
+        # %-deferred so str(exc) only runs when the record is actually emitted
+        logger.error(
+            "Uncaught exception: %s", exc,
+            extra={"path": request.scope.get("path", "")},
+            exc_info=True
+        )
+
+        # HOT.debug is frozen at process start (no SIGHUP reload); reading it
+        # here skips Pydantic's per-access descriptor path on the error route.
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "An unexpected error occurred",
+                "details": str(exc) if HOT.debug else None
+            }
+        )
 
 
 # ============================================================================
@@ -130,10 +242,17 @@ async def global_exception_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop + httptools drop per-request framework overhead substantially
+    # versus the asyncio/h11 defaults (both ship with uvicorn[standard]).
+    # Workers and --reload are mutually exclusive, so multi-worker serving
+    # only applies outside debug mode.
     uvicorn.run(
         "adapter.main:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        workers=1 if settings.debug else settings.api_workers,
+        loop="uvloop",
+        http="httptools",
         log_level=settings.log_level.lower()
     )
@@ -4,8 +4,11 @@ This module contains structured prompts for firearm eligibility risk assessment
 and text interpretation.
 """
 
-from typing import Dict, Any
-from datetime import datetime
+import functools
+import re
+from collections import defaultdict
+from typing import Dict, Any, Optional
+from datetime import date
 
 
 # =============================================================================
@@ -63,6 +66,106 @@ Return a JSON object with:
 Respond with JSON only:
 """
 
+# Role + instruction concatenated once at import; .format_map on this is
+# all that remains per prompt
+_RISK_TEMPLATE = f"{ROLE_RISK_EXPERT}\n\n{RISK_ASSESSMENT_INSTRUCTION}"
+
+
+BATCH_RISK_ASSESSMENT_INSTRUCTION = """
+Assess the risk level for EACH of the following firearm purchase applicants.
+
+**INPUT_RECORDS (JSON array):**
+{records_json}
+
+**Risk Assessment Criteria (apply to every record):**
+1. **Age Eligibility**: Must be 21+ years old
+2. **Background Check**: Any criminal record matches
+3. **ID Validity**: License number format and state consistency
+4. **Data Completeness**: Missing critical fields increase risk
+
+**Instructions:**
+Return a JSON array with EXACTLY {num_records} objects, one per input record,
+in the same order. Each object must contain:
+- `risk_score`: Float 0.0 (low risk) to 1.0 (high risk)
+- `risk_factors`: List of human-readable risk reasons
+- `confidence`: Your confidence in this assessment (0.0-1.0)
+- `requires_manual_review`: Boolean - true if ambiguous or borderline
+
+Respond with the JSON array only:
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dob(dob: str) -> Optional[date]:
+    """Parsed ISO DOB, or None if malformed; memoized since DOBs repeat."""
+    try:
+        # fromisoformat is the C fast path for exactly this shape
+        return date.fromisoformat(dob)
+    except ValueError:
+        return None
+
+
+def _age_from_dob(dob: str) -> str:
+    """Age in years for an ISO DOB string.
+
+    Only the parse is cached; the age is computed against today's date on
+    every call, since a memoized age goes stale at midnight across a
+    birthday - off by one in a prompt that gates a 21+ rule. The calendar
+    subtraction is exact where days // 365 drifted.
+    """
+    parsed = _parse_dob(dob)
+    if parsed is None:
+        return "Unknown"
+    today = date.today()
+    return str(
+        today.year - parsed.year - ((today.month, today.day) < (parsed.month, parsed.day))
+    )
+
+
+def _applicant_age(applicant_data: Dict[str, Any]) -> str:
+    """Age in years as a string, or "Unknown" if DOB missing/invalid."""
+    dob = applicant_data.get("dob")
+    return _age_from_dob(dob) if dob else "Unknown"
+
+
+def generate_batch_risk_assessment_prompt(applicants: list) -> str:
+    """
+    Generate one prompt assessing several applicants at once.
+
+    Packing records into a single message amortizes the role/instruction
+    tokens and the network round trip across the batch; the model is asked
+    for a same-length JSON array so results map back by position.
+
+    Args:
+        applicants: List of applicant_data dicts (see
+            generate_risk_assessment_prompt for the expected keys)
+
+    Returns:
+        Formatted prompt for GPT-4o mini
+    """
+    import json
+
+    records = [
+        {
+            "index": i,
+            "name": a.get("name", "Unknown"),
+            "dob": a.get("dob", "Unknown"),
+            "age": _applicant_age(a),
+            "state": a.get("state", "Unknown"),
+            "license_number": a.get("license_number", "Unknown"),
+            "address": a.get("address", "Unknown"),
+            "background_check": a.get("background_check", "No background check data available"),
+        }
+        for i, a in enumerate(applicants)
+    ]
+
+    return f"""{ROLE_RISK_EXPERT}
+
+{BATCH_RISK_ASSESSMENT_INSTRUCTION.format(
+    records_json=json.dumps(records, indent=2),
+    num_records=len(records),
+)}"""
+
 
 def generate_risk_assessment_prompt(applicant_data: Dict[str, Any]) -> str:
     """
@@ -91,29 +194,14 @@ def generate_risk_assessment_prompt(applicant_data: Dict[str, Any]) -> str:
         ... }
         >>> prompt = generate_risk_assessment_prompt(applicant)
     """
-    # Calculate age if DOB provided
-    age = "Unknown"
-    if "dob" in applicant_data and applicant_data["dob"]:
-        try:
-            dob = datetime.strptime(applicant_data["dob"], "%Y-%m-%d")
-            age = str((datetime.now() - dob).days // 365)
-        except:
-            age = "Unknown"
-
-    # Build prompt with role and instruction
-    prompt = f"""{ROLE_RISK_EXPERT}
-
-{RISK_ASSESSMENT_INSTRUCTION.format(
-    name=applicant_data.get('name', 'Unknown'),
-    dob=applicant_data.get('dob', 'Unknown'),
-    age=age,
-    state=applicant_data.get('state', 'Unknown'),
-    license_number=applicant_data.get('license_number', 'Unknown'),
-    address=applicant_data.get('address', 'Unknown'),
-    background_check=applicant_data.get('background_check', 'No background check data available')
-)}"""
-
-    return prompt
+    # format_map over the preconcatenated template: no per-call role +
+    # instruction join, no kwarg packing, and the defaultdict stands in
+    # for the per-field .get(..., 'Unknown') calls
+    fields = defaultdict(lambda: "Unknown", applicant_data)
+    fields["age"] = _applicant_age(applicant_data)
+    if "background_check" not in applicant_data:
+        fields["background_check"] = "No background check data available"
+    return _RISK_TEMPLATE.format_map(fields)
 
 
 # =============================================================================
@@ -207,6 +295,34 @@ Respond with JSON only:
 """
 
 
+# Deterministic digit-to-letter confusions the enhancement prompt itself
+# lists; str.translate applies the table as a C-level per-codepoint lookup.
+_OCR_FIX_TABLE = str.maketrans({"0": "O", "1": "I", "5": "S", "8": "B"})
+_NAME_SHAPE_RE = re.compile(r"^[A-Za-z][A-Za-z\- ]{0,48}[A-Za-z]$")
+
+
+def try_local_name_fix(name: str) -> Optional[str]:
+    """
+    Apply deterministic OCR digit substitutions without an LLM call.
+
+    Most OCR name errors are the trivial confusions the enhancement prompt
+    enumerates (0->O, 1->I, 5->S, 8->B); fixing them locally skips the LLM
+    round trip entirely. Callers should consult this first and only fall
+    back to generate_name_enhancement_prompt when it returns None.
+
+    Args:
+        name: OCR-extracted name that may contain errors
+
+    Returns:
+        Corrected name if the result looks like a plausible name,
+        otherwise None (caller should escalate to the LLM)
+    """
+    if not name:
+        return None
+    fixed = name.translate(_OCR_FIX_TABLE)
+    return fixed if _NAME_SHAPE_RE.match(fixed) else None
+
+
 def generate_name_enhancement_prompt(name: str) -> str:
     """
     Generate prompt for name correction/enhancement.
@@ -6,9 +6,33 @@ CRITICAL: NEVER log raw PII (names, DOBs, addresses, license numbers).
 
 import hashlib
 import json
+import re
 from typing import Dict, Any
 from adapter.config.settings import settings
 
+# PII patterns compiled once; redact_pii sits on every error path, so even
+# the re-module cache lookup per call is worth avoiding. The two date
+# shapes share one alternation to halve the full-string scans.
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_SSN_RE = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+_DATE_RE = re.compile(r'\b(?:\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4})\b')
+
+# Sanitization key tables: exact-name lookups cover the common case in
+# O(1); the alternation pattern catches derived names (full_name,
+# home_address, ...) without re-running a substring scan per known field.
+_EXACT_PII = frozenset({
+    "name", "full_name", "address", "license_number", "ssn", "email",
+    "phone", "dob", "date_of_birth",
+})
+_EXACT_ID = frozenset({"applicant_id", "registry_id", "check_id"})
+_FUZZY_PII_RE = re.compile(r'name|address|license|ssn|email|phone')
+_FUZZY_ID_RE = re.compile(r'applicant_id|registry_id|check_id')
+
+# Keyed-hash salt resolved once at import; BLAKE2's keyed mode caps keys at
+# 64 bytes. An empty salt falls back to plain (unkeyed) hashing.
+_PII_HASH_KEY = settings.pii_hash_salt.encode("utf-8")[:64]
+
 
 def hash_pii(value: str) -> str:
     """
@@ -18,12 +42,18 @@ def hash_pii(value: str) -> str:
         value: PII value to hash (applicant ID, name, etc.)
 
     Returns:
-        First 16 characters of SHA-256 hash
+        16-character hex digest (BLAKE2b-64, keyed when PII_HASH_SALT is set)
     """
     if not value:
         return "None"
 
-    return hashlib.sha256(value.encode()).hexdigest()[:16]
+    # BLAKE2b beats SHA-256 in software for short inputs, digest_size=8
+    # yields the 16 hex chars directly, and the built-in keyed mode guards
+    # against rainbow-table reversal without HMAC overhead. This runs per
+    # sanitized log field, so it sits on the logging hot path.
+    return hashlib.blake2b(
+        value.encode("utf-8"), digest_size=8, key=_PII_HASH_KEY
+    ).hexdigest()
 
 
 def sanitize_for_logging(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -36,37 +66,42 @@ def sanitize_for_logging(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Sanitized dictionary with PII hashed or removed
     """
-    if not settings.enable_pii_hashing:
-        # If PII hashing disabled (dev mode), log everything (NEVER do this in production!)
-        if settings.log_pii:
-            return data
-
-    sanitized = {}
-
-    # PII fields to hash
-    pii_fields = {"name", "full_name", "address", "license_number", "ssn", "email", "phone"}
-
-    # Sensitive fields to hash
-    id_fields = {"applicant_id", "registry_id", "check_id"}
-
-    for key, value in data.items():
-        key_lower = key.lower()
-
-        if any(pii_field in key_lower for pii_field in pii_fields):
-            # Hash PII fields
-            sanitized[key] = hash_pii(str(value)) if value else None
-        elif any(id_field in key_lower for id_field in id_fields):
-            # Hash ID fields
-            sanitized[f"{key}_hash"] = hash_pii(str(value)) if value else None
-        elif isinstance(value, dict):
-            # Recursively sanitize nested dictionaries
-            sanitized[key] = sanitize_for_logging(value)
-        elif key_lower == "dob" or key_lower == "date_of_birth":
-            # Hash DOB
-            sanitized[key] = hash_pii(str(value)) if value else None
-        else:
-            # Keep non-PII fields as-is
-            sanitized[key] = value
+    if not settings.enable_pii_hashing and settings.log_pii:
+        # Both dev-mode flags set: log everything unchanged and skip the
+        # walk entirely (NEVER do this in production!). Either flag alone
+        # still sanitizes - logging raw PII takes a deliberate double
+        # opt-in.
+        return data
+
+    # Iterative worklist instead of recursion: one frame regardless of
+    # nesting depth, and each key costs a set lookup on the common path
+    # instead of up to fourteen substring scans.
+    sanitized: Dict[str, Any] = {}
+    stack = [(data, sanitized)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            key_lower = key.lower()
+
+            if key_lower in _EXACT_PII:
+                # Hash PII fields (incl. DOB)
+                target[key] = hash_pii(str(value)) if value else None
+            elif key_lower in _EXACT_ID:
+                # Hash ID fields
+                target[f"{key}_hash"] = hash_pii(str(value)) if value else None
+            elif isinstance(value, dict):
+                # Sanitize nested dictionaries via the worklist
+                nested: Dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested))
+            elif _FUZZY_PII_RE.search(key_lower):
+                # Derived PII names (home_address, applicant_name, ...)
+                target[key] = hash_pii(str(value)) if value else None
+            elif _FUZZY_ID_RE.search(key_lower):
+                target[f"{key}_hash"] = hash_pii(str(value)) if value else None
+            else:
+                # Keep non-PII fields as-is
+                target[key] = value
 
     return sanitized
 
@@ -82,19 +117,15 @@ def redact_pii(text: str) -> str:
         Text with PII redacted
     """
     # Simple redaction - replace common PII patterns
-    import re
-
-    # Redact email addresses
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]', text)
+    text = _EMAIL_RE.sub('[EMAIL_REDACTED]', text)
 
     # Redact SSN patterns (XXX-XX-XXXX)
-    text = re.sub(r'\b\d{3}-\d{2}-\d{4}\b', '[SSN_REDACTED]', text)
+    text = _SSN_RE.sub('[SSN_REDACTED]', text)
 
     # Redact phone numbers
-    text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '[PHONE_REDACTED]', text)
+    text = _PHONE_RE.sub('[PHONE_REDACTED]', text)
 
     # Redact dates that look like DOBs (MM/DD/YYYY or YYYY-MM-DD)
-    text = re.sub(r'\b\d{4}-\d{2}-\d{2}\b', '[DATE_REDACTED]', text)
-    text = re.sub(r'\b\d{2}/\d{2}/\d{4}\b', '[DATE_REDACTED]', text)
+    text = _DATE_RE.sub('[DATE_REDACTED]', text)
 
     return text
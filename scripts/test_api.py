@@ -5,50 +5,150 @@ Sample API Test Script
 Tests the Gun Registry Adapter API endpoints with sample data.
 """
 
+import asyncio
 import base64
+import hashlib
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
+import aiohttp
 import requests
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 
-console = Console()
+# Rust-backed JSON (already a server dependency); stdlib json stays as the
+# guarded fallback for bare environments
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# SIMD-accelerated base64 (libbase64); falls back to the scalar stdlib encoder
+try:
+    import pybase64
+    _b64encode = pybase64.b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+from requests.adapters import HTTPAdapter, Retry
+
+import functools
+
+
+# Rich's import chain (40+ modules plus terminal detection) costs a few
+# hundred ms cold - a material slice of a script whose real work is one
+# HTTP call. The console is built on first styled print instead of at
+# import; early exits (server down, no images) use plain print.
+@functools.lru_cache(maxsize=1)
+def _console():
+    from rich.console import Console
+    return Console()
+
+
+class _LazyConsole:
+    """Print-compatible stand-in that defers the rich import to first use."""
+
+    def __getattr__(self, name):
+        return getattr(_console(), name)
+
+
+console = _LazyConsole()
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
 HEALTH_ENDPOINT = f"{API_BASE_URL}/api/v1/health"
 ELIGIBILITY_ENDPOINT = f"{API_BASE_URL}/api/v1/eligibility"
+UPLOAD_ENDPOINT = f"{API_BASE_URL}/api/v1/eligibility/upload"
+
+# One pooled session for every call in this script: bare requests.get/post
+# build a fresh Session (new TCP connection, handshake, DNS lookup) per
+# request, while a mounted adapter keeps sockets alive across the health
+# check and any looped eligibility runs. Headers are set once here rather
+# than rebuilt per call.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+# No session-wide Content-Type: json= and files= each set the right one,
+# and a pinned value would clobber the multipart boundary header
+SESSION.headers.update({"Connection": "keep-alive"})
 
 
 def check_server_health() -> bool:
-    """Check if API server is running."""
+    """Check if API server is running (plain print: runs before rich loads)."""
     try:
-        response = requests.get(HEALTH_ENDPOINT, timeout=5)
+        response = SESSION.get(HEALTH_ENDPOINT, timeout=5)
         if response.status_code == 200:
-            console.print("✅ Server is healthy", style="bold green")
+            print("✅ Server is healthy")
             return True
         else:
-            console.print(f"❌ Server returned status {response.status_code}", style="bold red")
+            print(f"❌ Server returned status {response.status_code}")
             return False
     except requests.exceptions.ConnectionError:
-        console.print("❌ Cannot connect to server. Is it running?", style="bold red")
-        console.print(f"   Run: python adapter/main.py", style="yellow")
+        print("❌ Cannot connect to server. Is it running?")
+        print("   Run: python adapter/main.py")
         return False
     except Exception as e:
-        console.print(f"❌ Error checking server health: {e}", style="bold red")
+        print(f"❌ Error checking server health: {e}")
         return False
 
 
+# Decision -> rich style, hoisted so the renderer doesn't rebuild the
+# constant dict per call
+_DECISION_COLOR = {
+    "APPROVED": "bold green",
+    "DENIED": "bold red",
+    "MANUAL_REVIEW": "bold yellow",
+}
+
+# Encoded images are cached on disk keyed by (path, mtime, size) so that
+# repeated runs against the same sample cards - the usual loop while
+# iterating on server code - skip the file read and base64 pass entirely.
+_ENCODE_CACHE_DIR = Path("/tmp/guncache")
+
+
 def encode_image_to_base64(image_path: str) -> Optional[str]:
-    """Encode image file to base64 string."""
+    """Encode image file to base64 string.
+
+    Results persist in a small disk cache; a warm run is one stat plus a
+    read of the cached text. On a miss the file is memory-mapped and the
+    encoder reads straight from the page cache - b64encode accepts any
+    buffer-protocol object, so the image is never copied into a userspace
+    heap buffer first. The output is strict ASCII, so decoding as "ascii"
+    takes CPython's fast path.
+    """
     try:
+        stat = os.stat(image_path)
+        key = hashlib.blake2b(
+            f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_path = _ENCODE_CACHE_DIR / f"{key}.b64"
+        if cache_path.exists():
+            return cache_path.read_text("ascii")
+
+        if stat.st_size == 0:
+            return ""
         with open(image_path, "rb") as image_file:
-            encoded = base64.b64encode(image_file.read()).decode("utf-8")
-            return encoded
+            mm = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                encoded = _b64encode(mm).decode("ascii")
+            finally:
+                mm.close()
+
+        # Atomic publish: write to a temp name, then rename into place so
+        # concurrent runs never see a half-written cache entry
+        _ENCODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(encoded, "ascii")
+        tmp_path.rename(cache_path)
+        return encoded
     except FileNotFoundError:
         console.print(f"❌ Image not found: {image_path}", style="bold red")
         return None
@@ -63,35 +163,35 @@ def test_eligibility_check(image_path: str, applicant_id: str = "test-12345") ->
     console.print("Testing Eligibility Check API", style="bold cyan")
     console.print("=" * 80 + "\n", style="cyan")
 
-    # Encode image
-    console.print(f"📷 Encoding image: {Path(image_path).name}", style="yellow")
-    image_base64 = encode_image_to_base64(image_path)
-    if not image_base64:
+    # Raw multipart upload: base64-in-JSON inflates the payload by ~33%
+    # and forces an encode here plus a decode server-side; the upload
+    # endpoint takes the bytes as-is via requests' streaming multipart
+    # encoder, so the image never sits in RAM as a JSON string
+    image_file = Path(image_path)
+    if not image_file.exists():
+        console.print(f"❌ Image not found: {image_path}", style="bold red")
         return {}
 
-    # Build request
-    request_data = {
-        "applicant_id": applicant_id,
-        "id_image_base64": image_base64
-    }
-
-    console.print(f"🚀 Sending request to: {ELIGIBILITY_ENDPOINT}", style="yellow")
+    console.print(f"🚀 Sending request to: {UPLOAD_ENDPOINT}", style="yellow")
     console.print(f"   Applicant ID: {applicant_id}", style="dim")
-    console.print(f"   Image size: {len(image_base64)} bytes (base64)", style="dim")
+    console.print(f"   Image size: {image_file.stat().st_size} bytes (raw)", style="dim")
 
     # Make request
     try:
-        response = requests.post(
-            ELIGIBILITY_ENDPOINT,
-            json=request_data,
-            headers={"Content-Type": "application/json"},
-            timeout=60  # OCR can take time
-        )
+        with open(image_path, "rb") as fh:
+            response = SESSION.post(
+                UPLOAD_ENDPOINT,
+                params={"applicant_id": applicant_id},
+                files={"id_image": (image_file.name, fh, "image/png")},
+                timeout=60  # OCR can take time
+            )
 
         console.print(f"\n📡 Response Status: {response.status_code}", style="bold")
 
         if response.status_code == 200:
-            result = response.json()
+            # orjson parses response.content directly - no response.text
+            # UTF-8 round trip and no pure-Python tokenizer above it
+            result = orjson.loads(response.content) if orjson is not None else response.json()
             display_eligibility_result(result)
             return result
         else:
@@ -107,73 +207,179 @@ def test_eligibility_check(image_path: str, applicant_id: str = "test-12345") ->
         return {}
 
 
+async def test_eligibility_check_async(
+    session: aiohttp.ClientSession,
+    image_path: str,
+    applicant_id: str
+) -> dict:
+    """
+    Run one eligibility check over a shared aiohttp session.
+
+    The client spends nearly all of its wall time waiting on server-side
+    OCR, so checks for several images are fanned out concurrently via
+    asyncio.gather in main(); the base64 encode is the only CPU-bound part
+    and runs in a worker thread. Rich rendering stays out of this coroutine
+    so interleaved output doesn't garble the console.
+
+    Args:
+        session: Shared aiohttp client session
+        image_path: Path to the driver license image
+        applicant_id: Applicant identifier to submit
+
+    Returns:
+        Response payload dict, or {} on failure
+    """
+    image_base64 = await asyncio.to_thread(encode_image_to_base64, image_path)
+    if not image_base64:
+        return {}
+
+    try:
+        async with session.post(
+            ELIGIBILITY_ENDPOINT,
+            json={"applicant_id": applicant_id, "id_image_base64": image_base64},
+            timeout=aiohttp.ClientTimeout(total=60)  # OCR can take time
+        ) as response:
+            if response.status == 200:
+                return await response.json()
+            console.print(
+                f"❌ {Path(image_path).name}: request failed with status {response.status}",
+                style="bold red"
+            )
+            return {}
+    except asyncio.TimeoutError:
+        console.print(f"❌ {Path(image_path).name}: request timed out (>60 seconds)", style="bold red")
+        return {}
+    except Exception as e:
+        console.print(f"❌ {Path(image_path).name}: error making request: {e}", style="bold red")
+        return {}
+
+
+async def run_eligibility_checks(image_paths: list) -> list:
+    """Fan all sample images out concurrently and collect their results."""
+    connector = aiohttp.TCPConnector(limit=8)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *(
+                test_eligibility_check_async(session, str(path), f"test-{i:05d}")
+                for i, path in enumerate(image_paths)
+            )
+        )
+
+
 def display_eligibility_result(result: dict):
-    """Display eligibility result in a formatted table."""
-    console.print("\n" + "=" * 80, style="green")
-    console.print("Eligibility Assessment Result", style="bold green")
-    console.print("=" * 80, style="green")
+    """Display eligibility result in a formatted table.
+
+    Everything is assembled into one rich Group and printed once: the 20+
+    individual console.print calls each paid for markup parsing, style
+    resolution, and a terminal write, which adds up (and flickers) when
+    the script runs in a loop.
+    """
+    from rich.console import Group
+    from rich.table import Table
+    from rich.text import Text
 
     # Decision
     decision = result.get("decision", "UNKNOWN")
-    decision_color = {
-        "APPROVED": "bold green",
-        "DENIED": "bold red",
-        "MANUAL_REVIEW": "bold yellow"
-    }.get(decision, "white")
-
-    console.print(f"\n🎯 Decision: {decision}", style=decision_color)
-    console.print(f"   Confidence: {result.get('confidence', 0):.2%}", style="bold")
-    console.print(f"   Manual Review Required: {result.get('requires_manual_review', False)}", style="bold")
+    decision_color = _DECISION_COLOR.get(decision, "white")
 
     # Extracted Data
-    console.print("\n📋 Extracted Data (Model A - OCR):", style="bold cyan")
     extracted = result.get("extracted_data", {})
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="white")
-
     for field, value in extracted.items():
         table.add_row(field, str(value))
 
-    console.print(table)
-
-    # Risk Assessment
-    console.print("\n⚠️  Risk Assessment (Model B):", style="bold yellow")
     risk = result.get("risk_assessment", {})
-    console.print(f"   Risk Score: {risk.get('risk_score', 0):.2%}", style="yellow")
-    console.print(f"   Confidence: {risk.get('confidence', 0):.2%}", style="yellow")
-    console.print(f"   Risk Factors:", style="yellow")
-    for factor in risk.get("risk_factors", []):
-        console.print(f"      • {factor}", style="dim yellow")
-
-    # Linkage Result
-    console.print("\n🔗 Linkage Result (Probabilistic Matching):", style="bold magenta")
     linkage = result.get("linkage_result", {})
-    console.print(f"   Matched: {linkage.get('matched', False)}", style="magenta")
-    console.print(f"   Confidence: {linkage.get('confidence', 0):.2%}", style="magenta")
-    console.print(f"   Requires Review: {linkage.get('requires_review', False)}", style="magenta")
 
-    if linkage.get("field_scores"):
-        console.print(f"   Field Scores:", style="magenta")
-        for field, score in linkage.get("field_scores", {}).items():
-            console.print(f"      {field}: {score:.2%}", style="dim magenta")
+    parts = [
+        Text("\n" + "=" * 80, style="green"),
+        Text("Eligibility Assessment Result", style="bold green"),
+        Text("=" * 80, style="green"),
+        Text(f"\n🎯 Decision: {decision}", style=decision_color),
+        Text(f"   Confidence: {result.get('confidence', 0):.2%}", style="bold"),
+        Text(f"   Manual Review Required: {result.get('requires_manual_review', False)}", style="bold"),
+        Text("\n📋 Extracted Data (Model A - OCR):", style="bold cyan"),
+        table,
+        Text("\n⚠️  Risk Assessment (Model B):", style="bold yellow"),
+        Text(f"   Risk Score: {risk.get('risk_score', 0):.2%}", style="yellow"),
+        Text(f"   Confidence: {risk.get('confidence', 0):.2%}", style="yellow"),
+        Text("   Risk Factors:", style="yellow"),
+    ]
+    parts.extend(
+        Text(f"      • {factor}", style="dim yellow")
+        for factor in risk.get("risk_factors", [])
+    )
+
+    parts.extend([
+        Text("\n🔗 Linkage Result (Probabilistic Matching):", style="bold magenta"),
+        Text(f"   Matched: {linkage.get('matched', False)}", style="magenta"),
+        Text(f"   Confidence: {linkage.get('confidence', 0):.2%}", style="magenta"),
+        Text(f"   Requires Review: {linkage.get('requires_review', False)}", style="magenta"),
+    ])
+    field_scores = linkage.get("field_scores") or {}
+    if field_scores:
+        parts.append(Text("   Field Scores:", style="magenta"))
+        parts.extend(
+            Text(f"      {field}: {score:.2%}", style="dim magenta")
+            for field, score in field_scores.items()
+        )
 
-    # Decision Rationale
-    console.print("\n💭 Decision Rationale:", style="bold blue")
-    for reason in result.get("decision_rationale", []):
-        console.print(f"   • {reason}", style="blue")
+    parts.append(Text("\n💭 Decision Rationale:", style="bold blue"))
+    parts.extend(
+        Text(f"   • {reason}", style="blue")
+        for reason in result.get("decision_rationale", [])
+    )
+    parts.append(Text("\n" + "=" * 80, style="green"))
 
-    console.print("\n" + "=" * 80, style="green")
+    console.print(Group(*parts))
 
 
+@functools.lru_cache(maxsize=1)
 def find_sample_images() -> list:
-    """Find sample driver license images."""
+    """Find sample driver license images.
+
+    os.scandir with a plain suffix check beats Path.glob (which fnmatches
+    every entry and builds a Path per file) on big synthetic_cards
+    directories, and the directory is immutable during a run, so the
+    result is cached per process.
+    """
     sample_dir = Path("data/raw/synthetic_cards")
-    if not sample_dir.exists():
+    try:
+        with os.scandir(sample_dir) as entries:
+            names = sorted(
+                e.name for e in entries if e.name.endswith(".png") and e.is_file()
+            )
+    except FileNotFoundError:
         return []
 
-    images = list(sample_dir.glob("*.png"))
-    return sorted(images)[:5]  # Return first 5
+    return [sample_dir / name for name in names[:5]]  # Return first 5
+
+
+def _write_response_json(path: str, result: dict):
+    """Write a response payload as pretty-printed JSON, one key at a time.
+
+    Serializing top-level sections separately keeps peak memory at the
+    largest single value instead of the whole concatenated document -
+    immaterial today, but the linkage result is slated to carry per-field
+    x per-candidate score matrices that can reach many MB. Keys are sorted
+    so successive dumps diff cleanly.
+    """
+    if orjson is not None:
+        dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        dumps = lambda obj: json.dumps(obj, indent=2, sort_keys=True).encode()
+
+    with open(path, "wb") as f:
+        f.write(b"{\n")
+        for i, key in enumerate(sorted(result)):
+            if i:
+                f.write(b",\n")
+            # Indent the value's lines one level so it nests under the key
+            value = dumps(result[key]).replace(b"\n", b"\n  ")
+            f.write(b'  "%s": %s' % (key.encode(), value))
+        f.write(b"\n}\n")
 
 
 def main():
@@ -198,29 +404,30 @@ def main():
 
     console.print(f"✅ Found {len(sample_images)} sample images", style="green")
 
-    # Test with first image
-    test_image = str(sample_images[0])
-    console.print(f"\n📸 Testing with: {Path(test_image).name}", style="bold yellow")
-
-    result = test_eligibility_check(test_image)
+    # Fan all images out concurrently: each request is ~100% server-side
+    # OCR wait, so the batch finishes in roughly the slowest request's
+    # wall time instead of the sum
+    console.print(f"\n📸 Testing {len(sample_images)} images concurrently...", style="bold yellow")
+    results = asyncio.run(run_eligibility_checks(sample_images))
+
+    succeeded = 0
+    for image_path, result in zip(sample_images, results):
+        if result:
+            succeeded += 1
+            console.print(f"\n📸 Result for: {Path(image_path).name}", style="bold yellow")
+            display_eligibility_result(result)
 
-    if result:
-        console.print("\n✅ Test completed successfully!", style="bold green")
-        console.print(f"\n💾 Full response saved to: test_response.json", style="dim")
+    if succeeded:
+        console.print(f"\n✅ {succeeded}/{len(sample_images)} checks completed successfully!", style="bold green")
+        console.print(f"\n💾 First full response saved to: test_response.json", style="dim")
 
-        # Save full response
-        with open("test_response.json", "w") as f:
-            json.dump(result, f, indent=2)
+        # Save first successful response
+        _write_response_json("test_response.json", next(r for r in results if r))
 
     else:
-        console.print("\n❌ Test failed", style="bold red")
+        console.print("\n❌ All checks failed", style="bold red")
         sys.exit(1)
 
-    # Offer to test more
-    if len(sample_images) > 1:
-        console.print(f"\n💡 {len(sample_images) - 1} more sample images available", style="dim")
-        console.print(f"   Run again to test different images", style="dim")
-
 
 if __name__ == "__main__":
     try:
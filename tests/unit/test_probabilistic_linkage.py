@@ -9,40 +9,169 @@ from adapter.core.linkage import ProbabilisticLinkageEngine
 from adapter.core.model_b.rapidfuzz_matcher import RapidFuzzMatcher
 
 
+# Fixtures live at module level: pytest deprecated scoped fixtures defined
+# as instance methods (PytestRemovedIn10Warning, a hard error on pytest 10).
+
+# Session-scoped: the engine is stateless across link() calls (its only
+# internal cache, the matcher's normalized-candidate table, is keyed by
+# candidate-list identity and read-only per list), so one instance
+# serves every test and the suite pays for construction once.
+@pytest.fixture(scope="session")
+def linkage_engine():
+    """Create linkage engine instance."""
+    return ProbabilisticLinkageEngine()
+
+
+@pytest.fixture(scope="session")
+def matcher():
+    """Create fuzzy matcher instance."""
+    return RapidFuzzMatcher()
+
+
+# Module-scoped: the dicts are logically immutable and no test mutates
+# them, so one construction serves the whole suite instead of one per
+# test. Sharing the same list object also exercises the matcher's
+# identity-keyed candidate cache the way production does.
+@pytest.fixture(scope="module")
+def sample_applicant():
+    """Sample applicant data."""
+    return {
+        "name": "John Michael Doe",
+        "dob": "1985-03-15",
+        "state": "FL",
+        "address": "123 Main St, Miami, FL 33101"
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_nics_records():
+    """Sample NICS records for testing."""
+    return [
+        {
+            "name": "John M. Doe",  # Slightly different format
+            "dob": "1985-03-15",  # Exact match
+            "state": "FL",
+            "address": "123 Main Street, Miami, FL 33101",  # Different formatting
+            "outcome": "approved"
+        },
+        {
+            "name": "Jane Smith",
+            "dob": "1990-05-20",
+            "state": "CA",
+            "address": "456 Oak Ave, Los Angeles, CA 90001",
+            "outcome": "denied"
+        },
+        {
+            "name": "Robert Johnson",
+            "dob": "1975-12-01",
+            "state": "TX",
+            "address": "789 Pine Rd, Houston, TX 77001",
+            "outcome": "approved"
+        }
+    ]
+
+
 class TestProbabilisticLinkageEngine:
     """Test suite for probabilistic linkage."""
 
-    @pytest.fixture
-    def linkage_engine(self):
-        """Create linkage engine instance."""
-        return ProbabilisticLinkageEngine()
-
-    @pytest.fixture
-    def sample_applicant(self):
-        """Sample applicant data."""
-        return {
-            "name": "John Michael Doe",
-            "dob": "1985-03-15",
-            "state": "FL",
-            "address": "123 Main St, Miami, FL 33101"
-        }
+    def test_exact_match_high_confidence(self, linkage_engine, sample_applicant, sample_nics_records):
+        """Test linkage with near-exact match returns high confidence."""
+        result = linkage_engine.link(sample_applicant, sample_nics_records)
 
-    @pytest.fixture
-    def sample_nics_records(self):
-        """Sample NICS records for testing."""
-        return [
-            {
-                "name": "John M. Doe",  # Slightly different format
-                "dob": "1985-03-15",  # Exact match
-                "state": "FL",
-                "address": "123 Main Street, Miami, FL 33101",  # Different formatting
-                "outcome": "approved"
-            },
+        # Should match first record (John Doe)
+        assert result.matched is True
+        assert result.confidence > 0.8  # High confidence due to name fuzzy match + exact DOB
+        assert result.best_match is not None
+        assert result.best_match["name"] == "John M. Doe"
+        assert result.requires_review is False  # High confidence, no review needed
+
+    # One parametrized test instead of four near-identical functions: the
+    # same link() call with per-case expectations, so pytest pays fixture
+    # resolution and capture setup once per case, not per hand-written test.
+    @pytest.mark.parametrize(
+        "applicant,expected_matched,min_name_score,expected_dob_score",
+        [
+            pytest.param(
+                {
+                    "name": "Doe, John Michael",  # Last name first
+                    "dob": "1985-03-15",
+                    "state": "FL",
+                    "address": "123 Main St, Miami, FL 33101"
+                },
+                True, 0.8, None,
+                id="fuzzy-name-word-order",
+            ),
+            pytest.param(
+                {
+                    "name": "John M. Doe",
+                    "dob": "1985-03-16",  # Off by 1 day
+                    "state": "FL",
+                    "address": "123 Main St, Miami, FL 33101"
+                },
+                None, None, 0.0,
+                id="dob-exact-match-only",
+            ),
+            pytest.param(
+                {
+                    "name": "Alice Williams",  # Completely different applicant
+                    "dob": "2000-01-01",
+                    "state": "NY",
+                    "address": "999 Broadway, New York, NY 10001"
+                },
+                False, None, None,
+                id="no-match-low-confidence",
+            ),
+            pytest.param(
+                {
+                    "name": "John M. Doe",  # Name similar, different state
+                    "dob": "1985-03-15",
+                    "state": "CA",
+                    "address": "Different address"
+                },
+                None, None, None,
+                id="partial-match-review-range",
+            ),
+        ],
+    )
+    def test_link_cases(
+        self,
+        linkage_engine,
+        sample_nics_records,
+        applicant,
+        expected_matched,
+        min_name_score,
+        expected_dob_score,
+    ):
+        """Test link() outcomes across match, fuzzy-name, DOB, and review cases."""
+        result = linkage_engine.link(applicant, sample_nics_records)
+
+        if expected_matched is not None:
+            assert result.matched is expected_matched
+            if expected_matched is False:
+                assert result.confidence < 0.7  # Low confidence
+                assert result.best_match is None
+        if min_name_score is not None:
+            # Fuzzy matching (token_set_ratio) handles word order variations
+            assert result.field_scores["name"] > min_name_score
+        if expected_dob_score is not None:
+            # DOB requires exact match (no fuzzy matching on dates)
+            assert result.field_scores["dob"] == expected_dob_score
+        # Medium confidence must always raise the manual review flag
+        if 0.7 <= result.confidence < 0.9:
+            assert result.requires_review is True
+
+    def test_blocking_prunes_preceding_records(self, linkage_engine, sample_applicant):
+        """Test candidate/record index mapping when blocking prunes earlier records."""
+        # Neither leading record shares the applicant's state or DOB year,
+        # so blocking drops them and the exact match is candidate 0 but
+        # record 2 - a regression test for field_scores being read with
+        # the record-space index
+        records = [
             {
                 "name": "Jane Smith",
                 "dob": "1990-05-20",
-                "state": "CA",
-                "address": "456 Oak Ave, Los Angeles, CA 90001",
+                "state": "NY",
+                "address": "456 Oak Ave, Albany, NY 12201",
                 "outcome": "denied"
             },
             {
@@ -51,82 +180,26 @@ class TestProbabilisticLinkageEngine:
                 "state": "TX",
                 "address": "789 Pine Rd, Houston, TX 77001",
                 "outcome": "approved"
+            },
+            {
+                "name": "John M. Doe",
+                "dob": "1985-03-15",
+                "state": "FL",
+                "address": "123 Main Street, Miami, FL 33101",
+                "outcome": "approved"
             }
         ]
 
-    def test_exact_match_high_confidence(self, linkage_engine, sample_applicant, sample_nics_records):
-        """Test linkage with near-exact match returns high confidence."""
-        result = linkage_engine.link(sample_applicant, sample_nics_records)
+        result = linkage_engine.link(sample_applicant, records)
 
-        # Should match first record (John Doe)
         assert result.matched is True
-        assert result.confidence > 0.8  # High confidence due to name fuzzy match + exact DOB
         assert result.best_match is not None
         assert result.best_match["name"] == "John M. Doe"
-        assert result.requires_review is False  # High confidence, no review needed
-
-    def test_no_match_low_confidence(self, linkage_engine, sample_nics_records):
-        """Test linkage with no good match returns low confidence."""
-        # Completely different applicant
-        different_applicant = {
-            "name": "Alice Williams",
-            "dob": "2000-01-01",
-            "state": "NY",
-            "address": "999 Broadway, New York, NY 10001"
-        }
-
-        result = linkage_engine.link(different_applicant, sample_nics_records)
-
-        assert result.matched is False  # Confidence below threshold
-        assert result.confidence < 0.7  # Low confidence
-        assert result.best_match is None
-
-    def test_fuzzy_name_matching(self, linkage_engine, sample_nics_records):
-        """Test fuzzy name matching handles variations."""
-        # Different name format
-        applicant = {
-            "name": "Doe, John Michael",  # Last name first
-            "dob": "1985-03-15",
-            "state": "FL",
-            "address": "123 Main St, Miami, FL 33101"
-        }
-
-        result = linkage_engine.link(applicant, sample_nics_records)
-
-        # Should still match due to fuzzy matching (token_set_ratio handles word order)
-        assert result.matched is True
-        assert result.field_scores["name"] > 0.8  # High name similarity
-
-    def test_dob_exact_match_only(self, linkage_engine, sample_nics_records):
-        """Test DOB requires exact match (no fuzzy matching on dates)."""
-        # Same name, different DOB
-        applicant = {
-            "name": "John M. Doe",
-            "dob": "1985-03-16",  # Off by 1 day
-            "state": "FL",
-            "address": "123 Main St, Miami, FL 33101"
-        }
-
-        result = linkage_engine.link(applicant, sample_nics_records)
-
-        # DOB field score should be 0.0 (no fuzzy matching)
-        assert result.field_scores["dob"] == 0.0
-
-    def test_manual_review_threshold(self, linkage_engine, sample_nics_records):
-        """Test manual review flag for medium confidence."""
-        # Partial match (name similar, but different state)
-        applicant = {
-            "name": "John M. Doe",
-            "dob": "1985-03-15",
-            "state": "CA",  # Different state
-            "address": "Different address"
-        }
-
-        result = linkage_engine.link(applicant, sample_nics_records)
-
-        # Might fall into manual review range (0.7-0.9)
-        if 0.7 <= result.confidence < 0.9:
-            assert result.requires_review is True
+        # Field scores must describe the matched record, not whichever
+        # record happens to sit at the candidate-space index
+        assert result.field_scores["name"] > 0.8
+        assert result.field_scores["dob"] == 1.0
+        assert result.field_scores["state"] == 1.0
 
     def test_empty_nics_records(self, linkage_engine, sample_applicant):
         """Test linkage with no NICS records."""
@@ -165,11 +238,6 @@ class TestProbabilisticLinkageEngine:
 class TestRapidFuzzMatcher:
     """Test suite for RapidFuzz fuzzy matcher."""
 
-    @pytest.fixture
-    def matcher(self):
-        """Create fuzzy matcher instance."""
-        return RapidFuzzMatcher()
-
     def test_exact_match_high_score(self, matcher):
         """Test exact match returns score of 1.0."""
         score = matcher.match_score("John Doe", "John Doe")